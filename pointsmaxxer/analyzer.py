@@ -10,6 +10,14 @@ from .models import Award, Deal, CabinClass, AppConfig
 from .portfolio import PortfolioManager
 
 
+# Terminal alert layout, shared by every call to AlertManager.format_terminal_alert
+_UNICORN_ALERT_TEMPLATE = (
+    "🦄 UNICORN: {origin}→{destination} {departure} {airline}\n"
+    "   {miles:,} {program} + ${fees:.0f} = ${cash_price:.0f} value ({cpp:.1f} cpp)"
+)
+_TRANSFER_LINE_TEMPLATE = "\n   Transfer: {source} → {program}"
+
+
 @dataclass
 class DealRanking:
     """Ranking criteria for deals."""
@@ -370,16 +378,25 @@ class AlertManager:
         flight = deal.award.flight
         award = deal.award
 
-        lines = [
-            f"🦄 UNICORN: {flight.origin}→{flight.destination} {flight.departure.strftime('%b %d')} {flight.airline_name or flight.airline_code}",
-            f"   {award.miles:,} {award.program} + ${award.cash_fees:.0f} = ${deal.cash_price:.0f} value ({deal.cpp:.1f} cpp)",
-        ]
+        alert = _UNICORN_ALERT_TEMPLATE.format(
+            origin=flight.origin,
+            destination=flight.destination,
+            departure=flight.departure.strftime("%b %d"),
+            airline=flight.airline_name or flight.airline_code,
+            miles=award.miles,
+            program=award.program,
+            fees=award.cash_fees,
+            cash_price=deal.cash_price,
+            cpp=deal.cpp,
+        )
 
         if deal.your_source_program:
-            source_name = deal.your_source_program
-            lines.append(f"   Transfer: {source_name} → {award.program}")
+            alert += _TRANSFER_LINE_TEMPLATE.format(
+                source=deal.your_source_program,
+                program=award.program,
+            )
 
-        return "\n".join(lines)
+        return alert
 
     def get_pending_alerts(self, deals: list[Deal]) -> list[Deal]:
         """Get deals that should be alerted."""
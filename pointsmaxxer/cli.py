@@ -20,7 +20,7 @@ from .database import Database
 from .models import AppConfig, CabinClass, PointsProgram, Route
 from .portfolio import PortfolioManager
 from .analyzer import DealAnalyzer
-from .scheduler import DaemonScheduler, AwardScanner
+from .scheduler import DaemonScheduler, AwardScanner, install_uvloop
 
 
 app = typer.Typer(
@@ -650,6 +650,7 @@ def daemon():
 
     scheduler = DaemonScheduler(config, on_unicorn=on_unicorn)
 
+    install_uvloop()
     try:
         asyncio.run(scheduler.run_forever())
     except KeyboardInterrupt:
@@ -683,6 +684,7 @@ def scan():
 
         await scheduler.close()
 
+    install_uvloop()
     asyncio.run(run())
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 import yaml
@@ -11,6 +12,12 @@ from pydantic import ValidationError
 
 from .models import AppConfig, CabinClass, Route, PointsProgram, Settings, AlertConfig
 
+try:
+    # libyaml bindings; several times faster than the pure-Python classes
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 
 DEFAULT_CONFIG_PATHS = [
     Path("config.yaml"),
@@ -55,7 +62,7 @@ def load_config(config_path: Optional[Path] = None) -> AppConfig:
         return create_default_config()
 
     with open(config_path, "r") as f:
-        raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(f, Loader=_SafeLoader)
 
     if raw_config is None:
         return create_default_config()
@@ -100,6 +107,8 @@ def parse_config(raw: dict) -> AppConfig:
         max_stops=raw_settings.get("max_stops", 1),
         cache_ttl_hours=raw_settings.get("cache_ttl_hours", 6),
         request_delay_seconds=raw_settings.get("request_delay_seconds", 2.0),
+        max_concurrency=raw_settings.get("max_concurrency", 3),
+        max_per_host=raw_settings.get("max_per_host", 2),
         seats_aero_api_key=raw_settings.get("seats_aero_api_key") or os.environ.get("SEATS_AERO_API_KEY"),
     )
 
@@ -163,6 +172,8 @@ def save_config(config: AppConfig, config_path: Path) -> None:
             "max_stops": config.settings.max_stops,
             "cache_ttl_hours": config.settings.cache_ttl_hours,
             "request_delay_seconds": config.settings.request_delay_seconds,
+            "max_concurrency": config.settings.max_concurrency,
+            "max_per_host": config.settings.max_per_host,
         },
         "alerts": {
             "terminal": config.alerts.terminal,
@@ -173,7 +184,7 @@ def save_config(config: AppConfig, config_path: Path) -> None:
     }
 
     with open(config_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
 
 
 def get_config_path() -> Path:
@@ -185,7 +196,7 @@ def get_config_path() -> Path:
 
 
 # Transfer partner mappings - static data
-TRANSFER_PARTNERS = {
+_TRANSFER_PARTNERS = {
     "chase_ur": {
         "united": 1.0,
         "aeroplan": 1.0,
@@ -244,9 +255,14 @@ TRANSFER_PARTNERS = {
         "eva": 1.0,
     },
 }
+# Shared by every caller, so exposed read-only, partner tables included
+TRANSFER_PARTNERS = MappingProxyType({
+    source: MappingProxyType(partners)
+    for source, partners in _TRANSFER_PARTNERS.items()
+})
 
 # Airline program codes and names
-AIRLINE_PROGRAMS = {
+AIRLINE_PROGRAMS = MappingProxyType({
     "aa": "American AAdvantage",
     "united": "United MileagePlus",
     "delta": "Delta SkyMiles",
@@ -270,4 +286,4 @@ AIRLINE_PROGRAMS = {
     "finnair": "Finnair Plus",
     "thai": "Thai Royal Orchid Plus",
     "eva": "EVA Infinity MileageLands",
-}
+})
@@ -7,9 +7,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Boolean, Text
+from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Boolean, Text, Index
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 
 from .models import Award, Deal, Flight, FlightAmenities, CabinClass
 
@@ -67,6 +67,11 @@ class DealRecord(Base):
     program = Column(String(50), nullable=False)
     miles = Column(Integer, nullable=False)
 
+    __table_args__ = (
+        Index("ix_deals_created_at", "created_at"),
+        Index("ix_deals_route", "origin", "destination", "cabin", "created_at"),
+    )
+
 
 class CashPriceRecord(Base):
     """SQLAlchemy model for cash price records."""
@@ -81,6 +86,13 @@ class CashPriceRecord(Base):
     source = Column(String(50), default="google_flights")
     scraped_at = Column(DateTime, default=datetime.now)
 
+    __table_args__ = (
+        Index(
+            "ix_cash_prices_lookup",
+            "origin", "destination", "departure_date", "cabin", "scraped_at",
+        ),
+    )
+
 
 class SearchHistoryRecord(Base):
     """SQLAlchemy model for search history."""
@@ -130,8 +142,60 @@ class Database:
         self.db_path = db_path
         self.engine = create_engine(f"sqlite:///{db_path}")
         Base.metadata.create_all(self.engine)
+        # create_all skips tables that already exist, so add any indexes
+        # introduced since an existing database was created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
         self.Session = sessionmaker(bind=self.engine)
 
+    @staticmethod
+    def _award_record(award: Award) -> AwardRecord:
+        """Build the ORM record for an award."""
+        return AwardRecord(
+            flight_no=award.flight.flight_no,
+            airline_code=award.flight.airline_code,
+            airline_name=award.flight.airline_name,
+            origin=award.flight.origin,
+            destination=award.flight.destination,
+            departure=award.flight.departure,
+            arrival=award.flight.arrival,
+            duration_minutes=award.flight.duration_minutes,
+            aircraft=award.flight.aircraft,
+            stops=award.flight.stops,
+            amenities_json=award.flight.amenities.model_dump_json(),
+            program=award.program,
+            program_name=award.program_name,
+            miles=award.miles,
+            cash_fees=award.cash_fees,
+            cabin=award.cabin.value,
+            booking_class=award.booking_class,
+            is_saver=award.is_saver,
+            availability=award.availability,
+            source=award.source,
+            scraped_at=award.scraped_at,
+        )
+
+    @staticmethod
+    def _deal_record(deal: Deal, award_id: int) -> DealRecord:
+        """Build the ORM record for a deal."""
+        return DealRecord(
+            award_id=award_id,
+            cash_price=deal.cash_price,
+            cpp=deal.cpp,
+            is_unicorn=deal.is_unicorn,
+            transferable_from_json=json.dumps(deal.transferable_from),
+            your_cost=deal.your_cost,
+            your_source_program=deal.your_source_program,
+            created_at=deal.created_at,
+            origin=deal.award.flight.origin,
+            destination=deal.award.flight.destination,
+            departure=deal.award.flight.departure,
+            cabin=deal.award.cabin.value,
+            program=deal.award.program,
+            miles=deal.award.miles,
+        )
+
     def save_award(self, award: Award) -> int:
         """Save an award to the database.
 
@@ -140,29 +204,7 @@ class Database:
         """
         session = self.Session()
         try:
-            record = AwardRecord(
-                flight_no=award.flight.flight_no,
-                airline_code=award.flight.airline_code,
-                airline_name=award.flight.airline_name,
-                origin=award.flight.origin,
-                destination=award.flight.destination,
-                departure=award.flight.departure,
-                arrival=award.flight.arrival,
-                duration_minutes=award.flight.duration_minutes,
-                aircraft=award.flight.aircraft,
-                stops=award.flight.stops,
-                amenities_json=award.flight.amenities.model_dump_json(),
-                program=award.program,
-                program_name=award.program_name,
-                miles=award.miles,
-                cash_fees=award.cash_fees,
-                cabin=award.cabin.value,
-                booking_class=award.booking_class,
-                is_saver=award.is_saver,
-                availability=award.availability,
-                source=award.source,
-                scraped_at=award.scraped_at,
-            )
+            record = self._award_record(award)
             session.add(record)
             session.commit()
             return record.id
@@ -177,28 +219,46 @@ class Database:
         """
         session = self.Session()
         try:
-            record = DealRecord(
-                award_id=award_id,
-                cash_price=deal.cash_price,
-                cpp=deal.cpp,
-                is_unicorn=deal.is_unicorn,
-                transferable_from_json=json.dumps(deal.transferable_from),
-                your_cost=deal.your_cost,
-                your_source_program=deal.your_source_program,
-                created_at=deal.created_at,
-                origin=deal.award.flight.origin,
-                destination=deal.award.flight.destination,
-                departure=deal.award.flight.departure,
-                cabin=deal.award.cabin.value,
-                program=deal.award.program,
-                miles=deal.award.miles,
-            )
+            record = self._deal_record(deal, award_id)
             session.add(record)
             session.commit()
             return record.id
         finally:
             session.close()
 
+    def save_awards_bulk(
+        self,
+        awards: list[Award],
+        deals: Optional[list[tuple[Deal, int]]] = None,
+    ) -> list[int]:
+        """Save a batch of awards and their deals in a single transaction.
+
+        Args:
+            awards: Awards to save.
+            deals: (deal, index into awards) pairs to save against the
+                matching award.
+
+        Returns:
+            The IDs of the saved awards, in input order.
+        """
+        session = self.Session()
+        try:
+            award_records = [self._award_record(award) for award in awards]
+            session.add_all(award_records)
+            session.flush()
+
+            award_ids = [record.id for record in award_records]
+            if deals:
+                session.add_all([
+                    self._deal_record(deal, award_ids[index])
+                    for deal, index in deals
+                ])
+
+            session.commit()
+            return award_ids
+        finally:
+            session.close()
+
     def save_cash_price(
         self,
         origin: str,
@@ -235,21 +295,20 @@ class Database:
         max_age_hours: int = 24
     ) -> Optional[float]:
         """Get cached cash price if available and recent."""
-        session = self.Session()
-        try:
-            cutoff = datetime.now().timestamp() - (max_age_hours * 3600)
-            record = session.query(CashPriceRecord).filter(
-                CashPriceRecord.origin == origin,
-                CashPriceRecord.destination == destination,
-                CashPriceRecord.departure_date == departure_date,
-                CashPriceRecord.cabin == cabin.value,
-            ).order_by(desc(CashPriceRecord.scraped_at)).first()
-
-            if record and record.scraped_at.timestamp() > cutoff:
-                return record.price
-            return None
-        finally:
-            session.close()
+        cutoff = datetime.now().timestamp() - (max_age_hours * 3600)
+        stmt = select(CashPriceRecord.price, CashPriceRecord.scraped_at).where(
+            CashPriceRecord.origin == origin,
+            CashPriceRecord.destination == destination,
+            CashPriceRecord.departure_date == departure_date,
+            CashPriceRecord.cabin == cabin.value,
+        ).order_by(desc(CashPriceRecord.scraped_at)).limit(1)
+
+        with self.engine.connect() as conn:
+            row = conn.execute(stmt).first()
+
+        if row and row.scraped_at.timestamp() > cutoff:
+            return row.price
+        return None
 
     def get_recent_deals(
         self,
@@ -359,30 +418,48 @@ class Database:
         finally:
             session.close()
 
-    def get_search_history(self, limit: int = 50) -> list[dict]:
-        """Get recent search history."""
+    def log_searches(self, searches: list[dict]) -> None:
+        """Log several searches to the history in a single transaction.
+
+        Args:
+            searches: Dicts with the same keys as log_search's arguments.
+        """
+        searched_at = datetime.now()
         session = self.Session()
         try:
-            records = session.query(SearchHistoryRecord).order_by(
-                desc(SearchHistoryRecord.searched_at)
-            ).limit(limit).all()
-
-            return [
-                {
-                    "origin": r.origin,
-                    "destination": r.destination,
-                    "cabin": r.cabin,
-                    "date_start": r.date_start,
-                    "date_end": r.date_end,
-                    "awards_found": r.awards_found,
-                    "unicorns_found": r.unicorns_found,
-                    "searched_at": r.searched_at,
-                }
-                for r in records
-            ]
+            session.add_all([
+                SearchHistoryRecord(
+                    origin=search["origin"],
+                    destination=search["destination"],
+                    cabin=search["cabin"].value,
+                    date_start=search["date_start"],
+                    date_end=search["date_end"],
+                    awards_found=search["awards_found"],
+                    unicorns_found=search["unicorns_found"],
+                    searched_at=searched_at,
+                )
+                for search in searches
+            ])
+            session.commit()
         finally:
             session.close()
 
+    def get_search_history(self, limit: int = 50) -> list[dict]:
+        """Get recent search history."""
+        stmt = select(
+            SearchHistoryRecord.origin,
+            SearchHistoryRecord.destination,
+            SearchHistoryRecord.cabin,
+            SearchHistoryRecord.date_start,
+            SearchHistoryRecord.date_end,
+            SearchHistoryRecord.awards_found,
+            SearchHistoryRecord.unicorns_found,
+            SearchHistoryRecord.searched_at,
+        ).order_by(desc(SearchHistoryRecord.searched_at)).limit(limit)
+
+        with self.engine.connect() as conn:
+            return [dict(row) for row in conn.execute(stmt).mappings()]
+
     def clear_old_data(self, days: int = 30) -> int:
         """Clear data older than specified days.
 
@@ -459,32 +536,25 @@ class Database:
 
     def get_watches(self, active_only: bool = True) -> list[dict]:
         """Get all route watches."""
-        session = self.Session()
-        try:
-            query = session.query(WatchRecord)
-            if active_only:
-                query = query.filter(WatchRecord.active == True)
-            query = query.order_by(desc(WatchRecord.created_at))
-            records = query.all()
-
-            return [
-                {
-                    "id": r.id,
-                    "origin": r.origin,
-                    "destination": r.destination,
-                    "cabin": r.cabin,
-                    "target_date": r.target_date,
-                    "min_cpp": r.min_cpp,
-                    "max_miles": r.max_miles,
-                    "active": r.active,
-                    "created_at": r.created_at,
-                    "last_checked": r.last_checked,
-                    "last_alert": r.last_alert,
-                }
-                for r in records
-            ]
-        finally:
-            session.close()
+        stmt = select(
+            WatchRecord.id,
+            WatchRecord.origin,
+            WatchRecord.destination,
+            WatchRecord.cabin,
+            WatchRecord.target_date,
+            WatchRecord.min_cpp,
+            WatchRecord.max_miles,
+            WatchRecord.active,
+            WatchRecord.created_at,
+            WatchRecord.last_checked,
+            WatchRecord.last_alert,
+        )
+        if active_only:
+            stmt = stmt.where(WatchRecord.active == True)
+        stmt = stmt.order_by(desc(WatchRecord.created_at))
+
+        with self.engine.connect() as conn:
+            return [dict(row) for row in conn.execute(stmt).mappings()]
 
     def remove_watch(self, watch_id: int) -> bool:
         """Remove a watch by ID.
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """Points portfolio manager for PointsMaxxer."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Optional
 
@@ -9,9 +10,21 @@ from .models import AppConfig, PointsProgram, TransferPartner
 from .config import TRANSFER_PARTNERS, AIRLINE_PROGRAMS
 
 
-@dataclass
+@dataclass(frozen=True)
 class TransferPath:
     """A path to transfer points to an airline program."""
+    # Explicit __slots__ rather than dataclass(slots=True) to keep Python 3.9 support
+    __slots__ = (
+        "source_program",
+        "source_name",
+        "target_program",
+        "target_name",
+        "ratio",
+        "points_needed",
+        "points_available",
+        "is_direct",
+    )
+
     source_program: str
     source_name: str
     target_program: str
@@ -35,6 +48,8 @@ class TransferPath:
 @dataclass
 class PortfolioSummary:
     """Summary of a user's points portfolio."""
+    __slots__ = ("total_points", "total_estimated_value", "programs", "best_values")
+
     total_points: int
     total_estimated_value: float
     programs: list[PointsProgram]
@@ -80,11 +95,21 @@ class PortfolioManager:
             config: Application configuration containing portfolio data.
         """
         self.config = config
+        self._name_cache: dict[str, str] = {}
+        self._index_programs()
         self._build_transfer_graph()
 
+    def _index_programs(self) -> None:
+        """Index portfolio programs by code; the first entry for a code wins."""
+        self._programs: dict[str, PointsProgram] = {}
+        for program in self.config.portfolio:
+            self._programs.setdefault(program.code, program)
+
     def _build_transfer_graph(self) -> None:
         """Build transfer partner graph from config."""
         self.transfer_graph: dict[str, dict[str, float]] = {}
+        # Reverse index: target program -> {source program: ratio}
+        self._reverse_graph: dict[str, dict[str, float]] = {}
 
         # Use config transfers if available, otherwise use defaults
         transfers = self.config.transfers if self.config.transfers else TRANSFER_PARTNERS
@@ -95,26 +120,34 @@ class PortfolioManager:
                 for partner_dict in partners:
                     for partner_code, ratio in partner_dict.items():
                         self.transfer_graph[source][partner_code] = ratio
-            elif isinstance(partners, dict):
+            elif isinstance(partners, Mapping):
                 for partner_code, ratio in partners.items():
                     self.transfer_graph[source][partner_code] = ratio
 
+        for source, partners in self.transfer_graph.items():
+            for partner_code, ratio in partners.items():
+                self._reverse_graph.setdefault(partner_code, {})[source] = ratio
+
     def get_program_name(self, code: str) -> str:
         """Get human-readable name for a program code."""
-        # First check user's portfolio
-        for program in self.config.portfolio:
-            if program.code == code:
-                return program.name
+        name = self._name_cache.get(code)
+        if name is not None:
+            return name
 
-        # Then check airline programs
-        return AIRLINE_PROGRAMS.get(code, code.upper())
+        # First check user's portfolio, then airline programs
+        program = self._programs.get(code)
+        if program is not None:
+            name = program.name
+        else:
+            name = AIRLINE_PROGRAMS.get(code, code.upper())
+
+        self._name_cache[code] = name
+        return name
 
     def get_balance(self, program_code: str) -> int:
         """Get balance for a program."""
-        for program in self.config.portfolio:
-            if program.code == program_code:
-                return program.balance
-        return 0
+        program = self._programs.get(program_code)
+        return program.balance if program is not None else 0
 
     def get_total_points(self) -> int:
         """Get total points across all programs."""
@@ -164,6 +197,10 @@ class PortfolioManager:
 
         # Check if user has direct points in target program
         direct_balance = self.get_balance(target_program)
+        if direct_balance == 0 and target_program not in self._reverse_graph:
+            # Nothing owned directly and no partner reaches the target
+            return paths
+
         if direct_balance > 0:
             paths.append(TransferPath(
                 source_program=target_program,
@@ -177,12 +214,13 @@ class PortfolioManager:
             ))
 
         # Check transfer partners
+        sources = self._reverse_graph.get(target_program, {})
         for program in self.config.portfolio:
             if program.code == target_program:
                 continue
 
-            if self.can_transfer_to(program.code, target_program):
-                ratio = self.get_transfer_ratio(program.code, target_program)
+            ratio = sources.get(program.code)
+            if ratio is not None:
                 # Calculate how many points needed from source
                 points_needed = int(miles_needed / ratio) if ratio > 0 else miles_needed
 
@@ -215,6 +253,23 @@ class PortfolioManager:
         Returns:
             Best transfer path or None if user can't afford any path.
         """
+        # An affordable direct balance wins outright unless some partner
+        # transfers in at better than 1:1
+        direct_balance = self.get_balance(target_program)
+        if direct_balance >= miles_needed > 0 and all(
+            ratio <= 1.0 for ratio in self._reverse_graph.get(target_program, {}).values()
+        ):
+            return TransferPath(
+                source_program=target_program,
+                source_name=self.get_program_name(target_program),
+                target_program=target_program,
+                target_name=self.get_program_name(target_program),
+                ratio=1.0,
+                points_needed=miles_needed,
+                points_available=direct_balance,
+                is_direct=True,
+            )
+
         paths = self.find_transfer_paths(target_program, miles_needed)
 
         # First, try to find an affordable path
@@ -233,11 +288,10 @@ class PortfolioManager:
         if self.get_balance(target_program) > 0:
             programs.append(target_program)
 
-        # Check transfer partners
-        for source, partners in self.transfer_graph.items():
-            if target_program in partners:
-                if self.get_balance(source) > 0:
-                    programs.append(source)
+        # Check transfer partners, via the reverse index
+        for source in self._reverse_graph.get(target_program, {}):
+            if self.get_balance(source) > 0:
+                programs.append(source)
 
         return programs
 
@@ -273,22 +327,25 @@ class PortfolioManager:
         Returns:
             True if program was found and updated.
         """
-        for program in self.config.portfolio:
-            if program.code == program_code:
-                program.balance = new_balance
-                return True
-        return False
+        program = self._programs.get(program_code)
+        if program is None:
+            return False
+        program.balance = new_balance
+        return True
 
     def add_program(self, program: PointsProgram) -> None:
         """Add a new program to the portfolio."""
+        self._name_cache.pop(program.code, None)
+
         # Check if already exists
-        for existing in self.config.portfolio:
-            if existing.code == program.code:
-                existing.balance = program.balance
-                existing.name = program.name
-                return
+        existing = self._programs.get(program.code)
+        if existing is not None:
+            existing.balance = program.balance
+            existing.name = program.name
+            return
 
         self.config.portfolio.append(program)
+        self._programs[program.code] = program
 
     def remove_program(self, program_code: str) -> bool:
         """Remove a program from the portfolio.
@@ -299,5 +356,8 @@ class PortfolioManager:
         for i, program in enumerate(self.config.portfolio):
             if program.code == program_code:
                 del self.config.portfolio[i]
+                self._name_cache.pop(program_code, None)
+                # A later duplicate of the code, if any, takes its place
+                self._index_programs()
                 return True
         return False
@@ -3,6 +3,8 @@ from __future__ import annotations
 """Scheduler for automated award scanning in PointsMaxxer."""
 
 import asyncio
+import time
+from contextlib import AsyncExitStack
 from datetime import datetime, timedelta
 from typing import Callable, Optional
 
@@ -10,18 +12,33 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from rich.console import Console
 
-from .models import AppConfig, ScanFrequency, CabinClass, Deal
+from .models import AppConfig, ScanFrequency, CabinClass, Award, Deal
 from .config import load_config
 from .database import Database
 from .portfolio import PortfolioManager
 from .analyzer import DealAnalyzer, AlertManager
-from .scrapers.base import ScraperRegistry
+from .scrapers.base import BaseScraper, ScraperRegistry
 from .scrapers.google_flights import GoogleFlightsScraper, get_fallback_price
+from .scrapers.seats_aero import SeatsAeroScraper
+from .utils.browser import BrowserManager
+from .utils.cache import ResponseCache
 
 
 console = Console()
 
 
+def install_uvloop() -> None:
+    """Use uvloop for event loops created from now on, if it is installed.
+
+    Call before asyncio.run; a loop that is already running keeps its type.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 class ScanResult:
     """Result of a scan operation."""
 
@@ -63,7 +80,55 @@ class AwardScanner:
         self.analyzer = DealAnalyzer(config, self.portfolio)
         self.alert_manager = AlertManager(config)
         self.on_unicorn = on_unicorn
+        # Award scrapers to run for every route (Google Flights only supplies cash prices)
+        self._active_scrapers: tuple[tuple[str, type[BaseScraper]], ...] = tuple(
+            (program_code, scraper_class)
+            for program_code, scraper_class in ScraperRegistry.get_all().items()
+            if program_code != "google_flights"
+        )
         self._cash_price_scraper: Optional[GoogleFlightsScraper] = None
+        # Award scrapers by program, kept with warm pages for the scanner's lifetime
+        self._scrapers: dict[str, BaseScraper] = {}
+        # Closes the scrapers' page pools
+        self._page_pools = AsyncExitStack()
+        # One Chromium instance shared by every scraper for the scanner's lifetime
+        self._browser: Optional[BrowserManager] = None
+        # One disk cache handle shared by every scraper, opened on first use
+        self._response_cache: Optional[ResponseCache] = None
+        # (origin, destination, date, cabin) -> (price, monotonic expiry)
+        self._price_cache: dict[tuple[str, str, str, str], tuple[float, float]] = {}
+        # Created on first use so they bind to the running event loop
+        self._browser_slots: Optional[asyncio.Semaphore] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._cash_price_lock: Optional[asyncio.Lock] = None
+
+    def _get_browser_slots(self) -> asyncio.Semaphore:
+        """Get the semaphore capping how many scraper browsers run at once."""
+        if self._browser_slots is None:
+            self._browser_slots = asyncio.Semaphore(self.config.settings.max_concurrency)
+        return self._browser_slots
+
+    async def _get_browser(self) -> BrowserManager:
+        """Get the shared browser, starting it on first use."""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+
+        # Routes and programs scan concurrently, so start it only once
+        async with self._browser_lock:
+            if self._browser is None:
+                browser = BrowserManager(
+                    request_delay=self.config.settings.request_delay_seconds,
+                    max_per_host=self.config.settings.max_per_host,
+                )
+                await browser.start()
+                self._browser = browser
+        return self._browser
+
+    def _get_response_cache(self) -> ResponseCache:
+        """Get the response cache shared by the scanner's scrapers."""
+        if self._response_cache is None:
+            self._response_cache = ResponseCache()
+        return self._response_cache
 
     async def scan_all_routes(self) -> ScanResult:
         """Scan all configured routes.
@@ -75,41 +140,57 @@ class AwardScanner:
 
         console.print(f"[bold blue]Starting scan of {len(self.config.routes)} routes...[/]")
 
-        for route in self.config.routes:
-            try:
-                # Skip wildcard destinations for now
-                if route.is_wildcard_destination():
-                    continue
+        # Skip wildcard destinations for now
+        routes = [route for route in self.config.routes if not route.is_wildcard_destination()]
 
-                route_result = await self._scan_route(
+        route_results = await asyncio.gather(
+            *(
+                self._scan_route(
                     origin=route.origin,
                     destination=route.destination,
                     cabin=route.cabin,
                 )
+                for route in routes
+            ),
+            return_exceptions=True,
+        )
 
-                result.awards_found += route_result.awards_found
-                result.deals_found += route_result.deals_found
-                result.unicorns_found += route_result.unicorns_found
-                result.unicorn_deals.extend(route_result.unicorn_deals)
-                result.errors.extend(route_result.errors)
-
-            except Exception as e:
-                result.errors.append(f"Error scanning {route.origin}-{route.destination}: {e}")
+        date_start = datetime.now()
+        date_end = date_start + timedelta(days=self.config.settings.search_window_days)
+        searches: list[dict] = []
+
+        for route, route_result in zip(routes, route_results):
+            search = {
+                "origin": route.origin,
+                "destination": route.destination,
+                "cabin": route.cabin,
+                "date_start": date_start,
+                "date_end": date_end,
+                "awards_found": 0,
+                "unicorns_found": 0,
+            }
+            searches.append(search)
+
+            if isinstance(route_result, Exception):
+                result.errors.append(f"Error scanning {route.origin}-{route.destination}: {route_result}")
+                continue
+            if isinstance(route_result, BaseException):
+                raise route_result
+
+            search["awards_found"] = route_result.awards_found
+            search["unicorns_found"] = route_result.unicorns_found
+
+            result.awards_found += route_result.awards_found
+            result.deals_found += route_result.deals_found
+            result.unicorns_found += route_result.unicorns_found
+            result.unicorn_deals.extend(route_result.unicorn_deals)
+            result.errors.extend(route_result.errors)
 
         result.completed_at = datetime.now()
 
-        # Log search to history
-        for route in self.config.routes:
-            if not route.is_wildcard_destination():
-                self.db.log_search(
-                    origin=route.origin,
-                    destination=route.destination,
-                    cabin=route.cabin,
-                    date_start=datetime.now(),
-                    date_end=datetime.now() + timedelta(days=self.config.settings.search_window_days),
-                    awards_found=result.awards_found,
-                    unicorns_found=result.unicorns_found,
-                )
+        # Log each route's own counts to history in one transaction
+        if searches:
+            await asyncio.to_thread(self.db.log_searches, searches)
 
         return result
 
@@ -140,89 +221,209 @@ class AwardScanner:
         # Get cash price for comparison
         cash_price = await self._get_cash_price(origin, destination, start_date, cabin)
 
-        # Scan each registered scraper
-        scrapers = ScraperRegistry.get_all()
-
-        for program_code, scraper_class in scrapers.items():
-            if program_code == "google_flights":
-                continue  # Skip cash price scraper
+        # Search every registered scraper concurrently
+        program_results = await asyncio.gather(
+            *(
+                self._search_program(
+                    program_code, scraper_class, origin, destination, start_date, end_date, cabin
+                )
+                for program_code, scraper_class in self._active_scrapers
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                async with scraper_class() as scraper:
-                    awards = await scraper.search_awards(
-                        origin=origin,
-                        destination=destination,
-                        date=start_date,
-                        cabin=cabin,
-                    )
+        pending_awards: list[Award] = []
+        pending_deals: list[tuple[Deal, int]] = []
 
-                    for award in awards:
-                        result.awards_found += 1
+        for (program_code, _), awards in zip(self._active_scrapers, program_results):
+            if isinstance(awards, Exception):
+                result.errors.append(f"{program_code}: {awards}")
+                continue
+            if isinstance(awards, BaseException):
+                raise awards
 
-                        # Save award to database
-                        award_id = self.db.save_award(award)
+            try:
+                for award in awards:
+                    # Analyze deal
+                    deal = self.analyzer.analyze_award(award, cash_price)
+                    pending_awards.append(award)
+                    if deal.is_unicorn:
+                        pending_deals.append((deal, len(pending_awards) - 1))
 
-                        # Analyze deal
-                        deal = self.analyzer.analyze_award(award, cash_price)
-                        result.deals_found += 1
+            except Exception as e:
+                result.errors.append(f"{program_code}: {e}")
 
-                        if deal.is_unicorn:
-                            result.unicorns_found += 1
-                            result.unicorn_deals.append(deal)
+        # Save the whole route in one transaction, off the event loop
+        if pending_awards:
+            try:
+                await asyncio.to_thread(self.db.save_awards_bulk, pending_awards, pending_deals)
+            except Exception as e:
+                result.errors.append(f"Error saving {origin}-{destination} results: {e}")
 
-                            # Save deal to database
-                            self.db.save_deal(deal, award_id)
+        result.awards_found = len(pending_awards)
+        result.deals_found = len(pending_awards)
 
-                            # Trigger callback
-                            if self.on_unicorn:
-                                self.on_unicorn(deal)
+        for deal, _ in pending_deals:
+            result.unicorns_found += 1
+            result.unicorn_deals.append(deal)
 
-                            # Print alert
-                            if self.config.alerts.terminal:
-                                alert_text = self.alert_manager.format_terminal_alert(deal)
-                                console.print(f"\n[bold yellow]{alert_text}[/]\n")
+            # Trigger callback
+            if self.on_unicorn:
+                self.on_unicorn(deal)
 
-            except Exception as e:
-                result.errors.append(f"{program_code}: {e}")
+            # Print alert
+            if self.config.alerts.terminal:
+                alert_text = self.alert_manager.format_terminal_alert(deal)
+                console.print(f"\n[bold yellow]{alert_text}[/]\n")
 
         result.completed_at = datetime.now()
         return result
 
-    async def _get_cash_price(
+    async def _get_scraper(
+        self,
+        program_code: str,
+        scraper_class: type[BaseScraper],
+    ) -> BaseScraper:
+        """Get the scanner's scraper for a program, creating it on first use.
+
+        Each scraper keeps the pages it opens, so later searches only
+        navigate instead of setting up a new context.
+        """
+        scraper = self._scrapers.get(program_code)
+        if scraper is None:
+            browser = await self._get_browser()
+            # Another search may have created it while the browser started
+            scraper = self._scrapers.get(program_code)
+            if scraper is None:
+                extra = {}
+                if issubclass(scraper_class, SeatsAeroScraper):
+                    extra["api_key"] = self.config.settings.seats_aero_api_key
+                scraper = scraper_class(
+                    browser_manager=browser,
+                    cache=self._get_response_cache(),
+                    **extra,
+                )
+                self._scrapers[program_code] = scraper
+                await self._page_pools.enter_async_context(scraper.pooled_pages())
+        return scraper
+
+    async def _search_program(
         self,
+        program_code: str,
+        scraper_class: type[BaseScraper],
         origin: str,
         destination: str,
         date: datetime,
+        end_date: datetime,
         cabin: CabinClass,
-    ) -> float:
-        """Get cash price for a route.
+    ) -> list[Award]:
+        """Search one program, holding a browser slot for the whole session.
 
-        Attempts to scrape from Google Flights, falls back to estimates.
+        Seats.aero needs no browser, and one query covers the route's whole
+        window from date to end_date; other programs search date only.
         """
-        try:
-            if self._cash_price_scraper is None:
-                self._cash_price_scraper = GoogleFlightsScraper()
+        scraper = await self._get_scraper(program_code, scraper_class)
+        if isinstance(scraper, SeatsAeroScraper):
+            by_date = await scraper.search_awards_bulk(
+                [(origin, destination)], date, end_date, cabin
+            )
+            return [award for awards in by_date.values() for award in awards]
 
-            price = await self._cash_price_scraper.get_cash_price(
+        async with self._get_browser_slots():
+            return await scraper.search_awards(
                 origin=origin,
                 destination=destination,
                 date=date,
                 cabin=cabin,
             )
 
+    async def _get_cash_price(
+        self,
+        origin: str,
+        destination: str,
+        date: datetime,
+        cabin: CabinClass,
+    ) -> float:
+        """Get cash price for a route.
+
+        Attempts to scrape from Google Flights, falls back to estimates.
+        Scraped prices are kept in memory for settings.cache_ttl_hours so
+        routes repeated within or across scans skip the browser entirely.
+        Estimates are not kept, so the next lookup tries the scrape again.
+        """
+        key = (origin, destination, date.date().isoformat(), cabin.value)
+        cached = self._price_cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        price = await self._fetch_cash_price(origin, destination, date, cabin)
+        if price is None:
+            return get_fallback_price(origin, destination, cabin)
+
+        self._price_cache[key] = (
+            price,
+            time.monotonic() + self.config.settings.cache_ttl_hours * 3600,
+        )
+        return price
+
+    async def _fetch_cash_price(
+        self,
+        origin: str,
+        destination: str,
+        date: datetime,
+        cabin: CabinClass,
+    ) -> Optional[float]:
+        """Scrape the cash price for a route, or None if it couldn't be found."""
+        if self._cash_price_lock is None:
+            self._cash_price_lock = asyncio.Lock()
+
+        try:
+            browser = await self._get_browser()
+            # Routes scan concurrently, so create the shared scraper only
+            # once, and publish it only after its page pool is open
+            async with self._cash_price_lock:
+                if self._cash_price_scraper is None:
+                    scraper = GoogleFlightsScraper(
+                        browser_manager=browser,
+                        cache=self._get_response_cache(),
+                    )
+                    await self._page_pools.enter_async_context(scraper.pooled_pages())
+                    self._cash_price_scraper = scraper
+
+            async with self._get_browser_slots():
+                price = await self._cash_price_scraper.get_cash_price(
+                    origin=origin,
+                    destination=destination,
+                    date=date,
+                    cabin=cabin,
+                )
+
             if price:
                 return price
 
         except Exception:
             pass
 
-        # Fallback to estimate
-        return get_fallback_price(origin, destination, cabin)
+        return None
 
     async def close(self) -> None:
         """Cleanup resources."""
+        # Scrapers first, so background refreshes are cancelled before
+        # the pages they may be using are closed
+        for scraper in self._scrapers.values():
+            await scraper.close()
+        self._scrapers.clear()
         if self._cash_price_scraper:
             await self._cash_price_scraper.close()
+            self._cash_price_scraper = None
+        await self._page_pools.aclose()
+        self._page_pools = AsyncExitStack()
+        if self._browser:
+            await self._browser.stop()
+            self._browser = None
+        if self._response_cache:
+            self._response_cache.close()
+            self._response_cache = None
 
 
 class DaemonScheduler:
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+"""Text parsers shared by the browser-based award scrapers."""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+
+
+_DURATION_RE = re.compile(r"(\d+)h\s*(\d+)?m?")
+_PRICE_RE = re.compile(r"\$?([\d,]+(?:\.\d{2})?)")
+
+
+# Result pages repeat the same strings across many cards, so the parsers
+# are memoised.
+@lru_cache(maxsize=4096)
+def parse_duration(text: str) -> int:
+    """Parse duration text like "5h 30m" to minutes."""
+    match = _DURATION_RE.search(text)
+    if match:
+        hours = int(match.group(1))
+        minutes = int(match.group(2)) if match.group(2) else 0
+        return hours * 60 + minutes
+    return 0
+
+
+@lru_cache(maxsize=4096)
+def parse_miles(text: str) -> int:
+    """Parse miles text like "57,500 miles" to an integer."""
+    # str.isdecimal keeps exactly the characters regex \d matches
+    cleaned = "".join(filter(str.isdecimal, text))
+    return int(cleaned) if cleaned else 0
+
+
+@lru_cache(maxsize=4096)
+def parse_price(text: str) -> float:
+    """Parse price text like "$5.60" to a float."""
+    match = _PRICE_RE.search(text)
+    if match:
+        return float(match.group(1).replace(",", ""))
+    return 0.0
+
+
+@lru_cache(maxsize=4096)
+def parse_time(text: str, base: datetime) -> datetime:
+    """Parse time text like "8:30 AM" or "14:30" to a datetime on base's date.
+
+    Args:
+        text: Time text from a result card.
+        base: Date the results are for; returned as-is if parsing fails.
+    """
+    # Hand-rolled rather than strptime, which builds a locale-aware regex
+    text = text.strip().upper()
+    meridiem = text[-2:]
+    if meridiem in ("AM", "PM"):
+        text = text[:-2].rstrip()
+    else:
+        meridiem = ""
+
+    hours, sep, minutes = text.partition(":")
+    if not (
+        sep
+        and 0 < len(hours) <= 2 and hours.isdecimal()
+        and 0 < len(minutes) <= 2 and minutes.isdecimal()
+    ):
+        return base
+
+    hour = int(hours)
+    minute = int(minutes)
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return base
+        hour = hour % 12 + (12 if meridiem == "PM" else 0)
+    if hour > 23 or minute > 59:
+        return base
+
+    return base.replace(hour=hour, minute=minute, second=0, microsecond=0)
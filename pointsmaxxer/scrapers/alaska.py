@@ -2,17 +2,57 @@ from __future__ import annotations
 
 """Alaska Airlines Mileage Plan scraper for PointsMaxxer."""
 
+import asyncio
 import re
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
+from urllib.parse import urlencode
 
 from playwright.async_api import Page
 
 from ..models import Award, CabinClass
+from ..utils.browser import extract_when_ready
 from ..utils.mouse import HumanMouse
+from ._parsers import parse_duration, parse_miles, parse_price, parse_time
 from .base import BaseScraper, register_scraper, ParseError
 
 
+# Partner carriers commonly shown on Alaska
+_CARRIERS = MappingProxyType({
+    "American": ("AA", "American Airlines"),
+    "Japan Airlines": ("JL", "Japan Airlines"),
+    "JAL": ("JL", "Japan Airlines"),
+    "Cathay": ("CX", "Cathay Pacific"),
+    "Qantas": ("QF", "Qantas"),
+    "Finnair": ("AY", "Finnair"),
+    "Emirates": ("EK", "Emirates"),
+    "Korean": ("KE", "Korean Air"),
+    "Singapore": ("SQ", "Singapore Airlines"),
+})
+_CARRIER_RE = re.compile("|".join(re.escape(name) for name in _CARRIERS))
+
+# Reads every field of a flight result in one browser round-trip. Missing
+# elements fall back to the defaults the parser has always used.
+_RESULT_FIELDS_JS = """(el) => {
+    const text = (selector, fallback) => {
+        const node = el.querySelector(selector);
+        return node ? node.innerText : fallback;
+    };
+    return {
+        flight_no: text(".flight-number", "AS???"),
+        departure: text(".depart-time", "00:00"),
+        arrival: text(".arrive-time", "00:00"),
+        duration: text(".flight-duration", "0h 0m"),
+        miles: text(".miles-required, .award-miles", "0"),
+        fees: text(".taxes-fees", "$0"),
+        is_saver: el.querySelector(".saver-award, .saver") !== null,
+        operating: text(".operated-by", null),
+        aircraft: text(".aircraft-type", null),
+    };
+}"""
+
+
 @register_scraper("alaska")
 class AlaskaScraper(BaseScraper):
     """Scraper for Alaska Airlines Mileage Plan awards."""
@@ -36,30 +76,33 @@ class AlaskaScraper(BaseScraper):
         cabin: CabinClass,
     ) -> list[Award]:
         """Search for Alaska award availability."""
-        browser = await self._ensure_browser()
         cache = await self._ensure_cache()
 
-        cache_key = f"alaska_{origin}_{destination}_{date.strftime('%Y-%m-%d')}_{cabin.value}"
-        cached = cache.get(cache_key)
+        cache_key = f"alaska_{origin}_{destination}_{date.date().isoformat()}_{cabin.value}"
+        remembered = self._recall_awards(cache_key)
+        if remembered is not None:
+            return remembered
+        cached = await asyncio.to_thread(cache.get, cache_key)
         if cached:
-            return [Award.model_validate(a) for a in cached]
+            return self._load_awards(cached)
 
         awards = []
 
-        async with browser.get_page() as page:
+        async with self._page() as page:
             mouse = HumanMouse(page)
 
             try:
                 search_url = self._build_search_url(origin, destination, date, cabin)
-                await page.goto(search_url, wait_until="networkidle")
-
-                await page.wait_for_selector(
-                    ".flight-result, .no-flights-message",
-                    timeout=30000
-                )
+                await self._goto(page, search_url)
 
                 awards = await self._parse_results(page, origin, destination, date, cabin)
-                cache.set(cache_key, [a.model_dump() for a in awards], ttl_hours=6)
+                # Nothing found may just mean the page hadn't rendered yet;
+                # leave it uncached so the next search scrapes again
+                if awards:
+                    await asyncio.to_thread(
+                        cache.set, cache_key, self._dump_awards(awards), ttl_hours=6
+                    )
+                    self._remember_awards(cache_key, awards, ttl_hours=6)
 
             except Exception as e:
                 raise ParseError(f"Failed to parse Alaska results: {e}")
@@ -74,21 +117,21 @@ class AlaskaScraper(BaseScraper):
         cabin: CabinClass,
     ) -> str:
         """Build Alaska search URL."""
-        date_str = date.strftime("%m/%d/%Y")
+        date_str = f"{date.month:02d}/{date.day:02d}/{date.year}"
         cabin_code = self.CABIN_MAP.get(cabin, "coach")
 
-        return (
-            f"{self.BASE_URL}/shopping/flights/search"
-            f"?A=1"  # Adults
-            f"&FT=true"  # Award travel
-            f"&O={origin}"
-            f"&D={destination}"
-            f"&OD={date_str}"
-            f"&OT=ANY"
-            f"&RT=false"  # One-way
-            f"&ShopType=A"  # Award
-            f"&C={cabin_code}"
-        )
+        query = urlencode({
+            "A": 1,  # Adults
+            "FT": "true",  # Award travel
+            "O": origin,
+            "D": destination,
+            "OD": date_str,
+            "OT": "ANY",
+            "RT": "false",  # One-way
+            "ShopType": "A",  # Award
+            "C": cabin_code,
+        }, safe="/")
+        return f"{self.BASE_URL}/shopping/flights/search?{query}"
 
     async def _parse_results(
         self,
@@ -101,144 +144,68 @@ class AlaskaScraper(BaseScraper):
         """Parse Alaska search results."""
         awards = []
 
-        no_results = await page.query_selector(".no-flights-message")
-        if no_results:
-            return []
-
-        flight_results = await page.query_selector_all(".flight-result, [data-testid='flight-row']")
+        # Every row is for the searched date; resolve times against it
+        base = date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Wait for results and extract every result in one round-trip,
+        # then build awards locally
+        rows = await extract_when_ready(
+            page,
+            ready_selector=".flight-result, .no-flights-message",
+            empty_selector=".no-flights-message",
+            item_selector=".flight-result, [data-testid='flight-row']",
+            extract_js=_RESULT_FIELDS_JS,
+        )
 
-        for result in flight_results:
+        for fields in rows:
             try:
-                award = await self._parse_flight_result(result, origin, destination, cabin)
+                award = self._award_from_fields(fields, origin, destination, cabin, base)
                 if award:
                     awards.append(award)
-            except Exception:
+            except (KeyError, TypeError, AttributeError, ValueError):
+                # Malformed row; pydantic's ValidationError is a ValueError
                 continue
 
         return awards
 
-    async def _parse_flight_result(
+    def _award_from_fields(
         self,
-        result,
+        fields: dict,
         origin: str,
         destination: str,
         cabin: CabinClass,
+        base: datetime,
     ) -> Optional[Award]:
-        """Parse a single Alaska flight result."""
-        try:
-            flight_no_elem = await result.query_selector(".flight-number")
-            flight_no = await flight_no_elem.inner_text() if flight_no_elem else "AS???"
-
-            dep_time_elem = await result.query_selector(".depart-time")
-            arr_time_elem = await result.query_selector(".arrive-time")
-
-            dep_time = await dep_time_elem.inner_text() if dep_time_elem else "00:00"
-            arr_time = await arr_time_elem.inner_text() if arr_time_elem else "00:00"
-
-            duration_elem = await result.query_selector(".flight-duration")
-            duration_text = await duration_elem.inner_text() if duration_elem else "0h 0m"
-            duration_minutes = self._parse_duration(duration_text)
-
-            miles_elem = await result.query_selector(".miles-required, .award-miles")
-            miles_text = await miles_elem.inner_text() if miles_elem else "0"
-            miles = self._parse_miles(miles_text)
-
-            if miles <= 0:
-                return None
-
-            fees_elem = await result.query_selector(".taxes-fees")
-            fees_text = await fees_elem.inner_text() if fees_elem else "$0"
-            fees = self._parse_price(fees_text)
-
-            # Alaska marks saver awards
-            is_saver = False
-            saver_elem = await result.query_selector(".saver-award, .saver")
-            if saver_elem:
-                is_saver = True
-
-            # Determine operating carrier (Alaska partners with many airlines)
-            operating_elem = await result.query_selector(".operated-by")
-            airline_name = "Alaska Airlines"
-            airline_code = "AS"
-            if operating_elem:
-                operating_text = await operating_elem.inner_text()
-                carriers = {
-                    "American": ("AA", "American Airlines"),
-                    "Japan Airlines": ("JL", "Japan Airlines"),
-                    "JAL": ("JL", "Japan Airlines"),
-                    "Cathay": ("CX", "Cathay Pacific"),
-                    "Qantas": ("QF", "Qantas"),
-                    "Finnair": ("AY", "Finnair"),
-                    "Emirates": ("EK", "Emirates"),
-                    "Korean": ("KE", "Korean Air"),
-                    "Singapore": ("SQ", "Singapore Airlines"),
-                }
-                for carrier_name, (code, full_name) in carriers.items():
-                    if carrier_name in operating_text:
-                        airline_code = code
-                        airline_name = full_name
-                        break
-
-            aircraft_elem = await result.query_selector(".aircraft-type")
-            aircraft = await aircraft_elem.inner_text() if aircraft_elem else None
-
-            departure = self._parse_time(dep_time)
-            arrival = self._parse_time(arr_time)
-
-            flight = self.create_flight(
-                flight_no=flight_no.strip(),
-                airline_code=airline_code,
-                airline_name=airline_name,
-                origin=origin,
-                destination=destination,
-                departure=departure,
-                arrival=arrival,
-                duration_minutes=duration_minutes,
-                aircraft=aircraft,
-            )
-
-            return self.create_award(
-                flight=flight,
-                miles=miles,
-                cabin=cabin,
-                cash_fees=fees,
-                is_saver=is_saver,
-            )
-
-        except Exception:
+        """Build an award from the fields extracted from a flight result."""
+        miles = parse_miles(fields["miles"])
+        if miles <= 0:
             return None
 
-    def _parse_duration(self, text: str) -> int:
-        match = re.search(r"(\d+)h\s*(\d+)?m?", text)
-        if match:
-            hours = int(match.group(1))
-            minutes = int(match.group(2)) if match.group(2) else 0
-            return hours * 60 + minutes
-        return 0
-
-    def _parse_miles(self, text: str) -> int:
-        cleaned = re.sub(r"[^\d]", "", text)
-        return int(cleaned) if cleaned else 0
-
-    def _parse_price(self, text: str) -> float:
-        match = re.search(r"\$?([\d,]+(?:\.\d{2})?)", text)
-        if match:
-            return float(match.group(1).replace(",", ""))
-        return 0.0
-
-    def _parse_time(self, text: str) -> datetime:
-        now = datetime.now()
-        try:
-            text = text.strip().upper()
-            if "AM" in text or "PM" in text:
-                time_obj = datetime.strptime(text, "%I:%M %p")
-            else:
-                time_obj = datetime.strptime(text, "%H:%M")
-            return now.replace(
-                hour=time_obj.hour,
-                minute=time_obj.minute,
-                second=0,
-                microsecond=0,
-            )
-        except ValueError:
-            return now
+        # Determine operating carrier (Alaska partners with many airlines)
+        airline_name = "Alaska Airlines"
+        airline_code = "AS"
+        operating_text = fields["operating"]
+        if operating_text is not None:
+            match = _CARRIER_RE.search(operating_text)
+            if match:
+                airline_code, airline_name = _CARRIERS[match.group(0)]
+
+        flight = self.create_flight(
+            flight_no=fields["flight_no"].strip(),
+            airline_code=airline_code,
+            airline_name=airline_name,
+            origin=origin,
+            destination=destination,
+            departure=parse_time(fields["departure"], base),
+            arrival=parse_time(fields["arrival"], base),
+            duration_minutes=parse_duration(fields["duration"]),
+            aircraft=fields["aircraft"],
+        )
+
+        return self.create_award(
+            flight=flight,
+            miles=miles,
+            cabin=cabin,
+            cash_fees=parse_price(fields["fees"]),
+            is_saver=fields["is_saver"],
+        )
@@ -3,17 +3,38 @@ from __future__ import annotations
 """Base scraper class for PointsMaxxer."""
 
 import asyncio
+import random
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Optional, Type
-
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncGenerator, Optional, Type
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from pydantic import TypeAdapter
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from ..models import Award, CabinClass, Flight, FlightAmenities
 from ..utils.browser import BrowserManager
 from ..utils.cache import ResponseCache
 
 
+# Serialises cached award lists as JSON bytes; validate_json parses and
+# validates in pydantic-core without building intermediate Python dicts
+_AWARD_LIST = TypeAdapter(list[Award])
+
+# Awards each scraper keeps in memory ahead of the response cache
+_MEMORY_CACHE_SIZE = 1024
+
+
 class ScraperError(Exception):
     """Base exception for scraper errors."""
     pass
@@ -24,13 +45,21 @@ class RateLimitError(ScraperError):
     pass
 
 
-class AuthenticationError(ScraperError):
-    """Raised when authentication fails."""
+class ParseError(ScraperError):
+    """Raised when response parsing fails."""
     pass
 
 
-class ParseError(ScraperError):
-    """Raised when response parsing fails."""
+class AuthenticationError(ParseError):
+    """Raised when authentication fails; not retried.
+
+    A ParseError, since bad credentials used to be reported as one.
+    """
+    pass
+
+
+class QuotaExceededError(ScraperError):
+    """Raised when a request quota is used up; not retried."""
     pass
 
 
@@ -47,6 +76,7 @@ class BaseScraper(ABC):
         browser_manager: Optional[BrowserManager] = None,
         cache: Optional[ResponseCache] = None,
         request_delay: float = 2.0,
+        max_concurrency: int = 3,
     ):
         """Initialize scraper.
 
@@ -54,11 +84,22 @@ class BaseScraper(ABC):
             browser_manager: Browser manager instance.
             cache: Response cache instance.
             request_delay: Delay between requests in seconds.
+            max_concurrency: Maximum dates searched at once in search_date_range.
         """
         self._browser = browser_manager
         self._cache = cache
         self.request_delay = request_delay
+        self.max_concurrency = max_concurrency
         self._owns_browser = False
+        # Idle pages, each with the stack that closes it, inside pooled_pages
+        self._page_pool: Optional[list[tuple[Page, AsyncExitStack]]] = None
+        # Scrapes in progress by cache key, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Awards this scraper scraped, keyed by response cache key, so a repeat
+        # search skips the disk read and revalidation. Values are (expires_at,
+        # awards) on the time.monotonic clock, least recently used first. Only
+        # used from the event loop, so it needs no lock.
+        self._memory_cache: OrderedDict[str, tuple[float, list[Award]]] = OrderedDict()
 
     async def _ensure_browser(self) -> BrowserManager:
         """Ensure browser is available."""
@@ -68,6 +109,65 @@ class BaseScraper(ABC):
             self._owns_browser = True
         return self._browser
 
+    @asynccontextmanager
+    async def _page(self, state_key: Optional[str] = None) -> AsyncGenerator[Page, None]:
+        """Get a page for one search.
+
+        Outside pooled_pages this is a fresh page from the browser
+        manager. Inside it, pages are kept open and reused across searches,
+        except a page whose search raised, which is closed instead.
+
+        Args:
+            state_key: Storage state key passed to BrowserManager.get_page.
+
+        Yields:
+            A configured Page instance.
+        """
+        browser = await self._ensure_browser()
+        if self._page_pool is None:
+            async with browser.get_page(state_key=state_key) as page:
+                yield page
+            return
+
+        pool = self._page_pool
+        if pool:
+            page, page_stack = pool.pop()
+        else:
+            page_stack = AsyncExitStack()
+            page = await page_stack.enter_async_context(browser.get_page(state_key=state_key))
+        try:
+            yield page
+        except BaseException as e:
+            # A timeout or crashed target can leave the page unusable
+            await page_stack.__aexit__(type(e), e, e.__traceback__)
+            raise
+        if self._page_pool is pool and not page.is_closed():
+            pool.append((page, page_stack))
+        else:
+            await page_stack.aclose()
+
+    @asynccontextmanager
+    async def pooled_pages(self) -> AsyncGenerator[None, None]:
+        """Keep pages opened by searches open for reuse until exit.
+
+        At most as many pages are opened as are in use at once. Nested
+        uses share the outermost pool. Storage state is saved when the
+        pool closes its pages.
+        """
+        if self._page_pool is not None:
+            yield
+            return
+
+        pool: list[tuple[Page, AsyncExitStack]] = []
+        self._page_pool = pool
+        try:
+            yield
+        finally:
+            self._page_pool = None
+            async with AsyncExitStack() as stack:
+                for _, page_stack in pool:
+                    stack.push_async_callback(page_stack.aclose)
+
     async def _ensure_cache(self) -> ResponseCache:
         """Ensure cache is available."""
         if self._cache is None:
@@ -115,26 +215,32 @@ class BaseScraper(ABC):
         Returns:
             List of all available awards in range.
         """
-        all_awards = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            try:
-                awards = await self.search_awards(origin, destination, current_date, cabin)
-                all_awards.extend(awards)
-            except Exception as e:
-                # Log but continue with other dates
-                print(f"Error searching {current_date}: {e}")
-
-            # Move to next day
-            current_date = datetime(
-                current_date.year,
-                current_date.month,
-                current_date.day + 1
+        days = (end_date.date() - start_date.date()).days
+        dates = [start_date + timedelta(days=i) for i in range(days + 1)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def search_one(search_date: datetime) -> list[Award]:
+            async with semaphore:
+                # Stagger requests rather than firing them in lockstep
+                await asyncio.sleep(random.uniform(0, self.request_delay))
+                return await self.search_awards(origin, destination, search_date, cabin)
+
+        # Pages opened by searches stay open for later dates; at most
+        # max_concurrency are ever in use at once
+        async with self.pooled_pages():
+            results = await asyncio.gather(
+                *(search_one(d) for d in dates), return_exceptions=True
             )
 
-            # Delay between requests
-            await asyncio.sleep(self.request_delay)
+        all_awards = []
+        for search_date, result in zip(dates, results):
+            if isinstance(result, Exception):
+                # Log but continue with other dates
+                print(f"Error searching {search_date}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                all_awards.extend(result)
 
         return all_awards
 
@@ -192,15 +298,93 @@ class BaseScraper(ABC):
             source=self.__class__.__name__,
         )
 
+    @staticmethod
+    def _dump_awards(awards: list[Award]) -> bytes:
+        """Serialize awards for the response cache."""
+        return _AWARD_LIST.dump_json(awards)
+
+    @staticmethod
+    def _load_awards(cached) -> list[Award]:
+        """Rebuild awards from a response cache entry."""
+        if isinstance(cached, bytes):
+            return _AWARD_LIST.validate_json(cached)
+        # Entries written before awards were cached as JSON
+        return _AWARD_LIST.validate_python(cached)
+
+    def _recall_awards(self, key: str) -> Optional[list[Award]]:
+        """Return awards this scraper cached for key, if still fresh."""
+        entry = self._memory_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, awards = entry
+        if time.monotonic() >= expires_at:
+            del self._memory_cache[key]
+            return None
+        self._memory_cache.move_to_end(key)
+        return list(awards)
+
+    def _remember_awards(self, key: str, awards: list[Award], ttl_hours: int) -> None:
+        """Keep freshly scraped awards in memory for the response cache TTL.
+
+        Empty results aren't kept, so the next search scrapes again.
+        """
+        if not awards:
+            return
+        self._memory_cache[key] = (time.monotonic() + ttl_hours * 3600, list(awards))
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+    async def _coalesce(self, key: str, fetch_func):
+        """Run fetch_func once for all concurrent callers with the same key.
+
+        Args:
+            key: Cache key identifying the search.
+            fetch_func: Coroutine function performing the scrape.
+
+        Returns:
+            Result of the shared fetch_func call.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch_func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller giving up doesn't cancel the others
+        return await asyncio.shield(future)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((RateLimitError, ParseError)),
+        retry=(
+            retry_if_exception_type((RateLimitError, ParseError))
+            & retry_if_not_exception_type(AuthenticationError)
+        ),
     )
     async def _fetch_with_retry(self, fetch_func):
         """Fetch with automatic retry on transient errors."""
         return await fetch_func()
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(PlaywrightTimeoutError),
+        reraise=True,
+    )
+    async def _goto(self, page: Page, url: str) -> None:
+        """Navigate to a URL, within the browser's per-host limit.
+
+        Navigation timeouts are retried with exponential backoff; the
+        host slot is released while waiting to retry.
+
+        Args:
+            page: Page to navigate.
+            url: URL to load.
+        """
+        browser = await self._ensure_browser()
+        async with browser.host_slot(urlsplit(url).hostname or ""):
+            await page.goto(url, wait_until="domcontentloaded")
+
     async def close(self) -> None:
         """Cleanup resources."""
         if self._owns_browser and self._browser:
@@ -2,17 +2,44 @@ from __future__ import annotations
 
 """Delta SkyMiles scraper for PointsMaxxer."""
 
-import re
+import asyncio
 from datetime import datetime
 from typing import Optional
 
 from playwright.async_api import Page
 
 from ..models import Award, CabinClass
+from ..utils.cache import ResponseCache
 from ..utils.mouse import HumanMouse
+from ._parsers import parse_duration, parse_miles, parse_price, parse_time
 from .base import BaseScraper, register_scraper, ParseError
 
 
+# Reads every field of a flight card in one browser round-trip. Missing
+# elements fall back to the defaults the parser has always used.
+_CARD_FIELDS_JS = """(el) => {
+    const text = (selector, fallback) => {
+        const node = el.querySelector(selector);
+        return node ? node.innerText : fallback;
+    };
+    return {
+        flight_no: text(".flight-number, [data-testid='flight-number']", "DL???"),
+        departure: text(".departure-time", "00:00"),
+        arrival: text(".arrival-time", "00:00"),
+        duration: text(".duration, .flight-duration", "0h 0m"),
+        miles: text(".miles, .award-miles", "0"),
+        fees: text(".taxes, .cash-price", "$0"),
+        // Delta awards are typically not marked as "saver" but they have
+        // partner availability which functions similarly
+        is_saver: el.querySelector(".partner-award") !== null,
+        aircraft: text(".aircraft", null),
+    };
+}"""
+
+# Same extraction applied to every matching card, in one round-trip
+_CARDS_FIELDS_JS = f"(els) => els.map({_CARD_FIELDS_JS})"
+
+
 @register_scraper("delta")
 class DeltaScraper(BaseScraper):
     """Scraper for Delta SkyMiles awards."""
@@ -36,22 +63,39 @@ class DeltaScraper(BaseScraper):
         cabin: CabinClass,
     ) -> list[Award]:
         """Search for Delta award availability."""
-        browser = await self._ensure_browser()
         cache = await self._ensure_cache()
 
-        cache_key = f"delta_{origin}_{destination}_{date.strftime('%Y-%m-%d')}_{cabin.value}"
-        cached = cache.get(cache_key)
+        cache_key = f"delta_{origin}_{destination}_{date.date().isoformat()}_{cabin.value}"
+        remembered = self._recall_awards(cache_key)
+        if remembered is not None:
+            return remembered
+        cached = await asyncio.to_thread(cache.get, cache_key)
         if cached:
-            return [Award.model_validate(a) for a in cached]
+            return self._load_awards(cached)
 
-        awards = []
+        # Concurrent searches for the same key share one scrape
+        awards = await self._coalesce(
+            cache_key,
+            lambda: self._scrape_awards(cache, cache_key, origin, destination, date, cabin),
+        )
+        return list(awards)
 
-        async with browser.get_page() as page:
+    async def _scrape_awards(
+        self,
+        cache: ResponseCache,
+        cache_key: str,
+        origin: str,
+        destination: str,
+        date: datetime,
+        cabin: CabinClass,
+    ) -> list[Award]:
+        """Scrape Delta results for a search and cache them."""
+        async with self._page() as page:
             mouse = HumanMouse(page)
 
             try:
                 search_url = self._build_search_url(origin, destination, date, cabin)
-                await page.goto(search_url, wait_until="networkidle")
+                await self._goto(page, search_url)
 
                 await page.wait_for_selector(
                     ".flight-results, .search-results, .no-results",
@@ -59,7 +103,13 @@ class DeltaScraper(BaseScraper):
                 )
 
                 awards = await self._parse_results(page, origin, destination, date, cabin)
-                cache.set(cache_key, [a.model_dump() for a in awards], ttl_hours=6)
+                # Nothing found may just mean the page hadn't rendered yet;
+                # leave it uncached so the next search scrapes again
+                if awards:
+                    await asyncio.to_thread(
+                        cache.set, cache_key, self._dump_awards(awards), ttl_hours=6
+                    )
+                    self._remember_awards(cache_key, awards, ttl_hours=6)
 
             except Exception as e:
                 raise ParseError(f"Failed to parse Delta results: {e}")
@@ -98,128 +148,59 @@ class DeltaScraper(BaseScraper):
         cabin: CabinClass,
     ) -> list[Award]:
         """Parse Delta search results."""
-        awards = []
-
         no_results = await page.query_selector(".no-results, .no-flights")
         if no_results:
             return []
 
-        flight_cards = await page.query_selector_all(
-            ".flight-card, [data-testid='flight-card']"
+        # Every card is for the searched date; resolve times against it
+        base = date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Extract every card in one round-trip, then build awards locally
+        rows = await page.eval_on_selector_all(
+            ".flight-card, [data-testid='flight-card']", _CARDS_FIELDS_JS
         )
 
-        for card in flight_cards:
+        awards = []
+        for fields in rows:
             try:
-                award = await self._parse_flight_card(card, origin, destination, cabin)
+                award = self._award_from_fields(fields, origin, destination, cabin, base)
                 if award:
                     awards.append(award)
-            except Exception:
+            except (KeyError, TypeError, AttributeError, ValueError):
+                # Malformed card; pydantic's ValidationError is a ValueError
                 continue
 
         return awards
 
-    async def _parse_flight_card(
+    def _award_from_fields(
         self,
-        card,
+        fields: dict,
         origin: str,
         destination: str,
         cabin: CabinClass,
+        base: datetime,
     ) -> Optional[Award]:
-        """Parse a single Delta flight card."""
-        try:
-            flight_no_elem = await card.query_selector(
-                ".flight-number, [data-testid='flight-number']"
-            )
-            flight_no = await flight_no_elem.inner_text() if flight_no_elem else "DL???"
-
-            dep_time_elem = await card.query_selector(".departure-time")
-            arr_time_elem = await card.query_selector(".arrival-time")
-
-            dep_time = await dep_time_elem.inner_text() if dep_time_elem else "00:00"
-            arr_time = await arr_time_elem.inner_text() if arr_time_elem else "00:00"
-
-            duration_elem = await card.query_selector(".duration, .flight-duration")
-            duration_text = await duration_elem.inner_text() if duration_elem else "0h 0m"
-            duration_minutes = self._parse_duration(duration_text)
-
-            miles_elem = await card.query_selector(".miles, .award-miles")
-            miles_text = await miles_elem.inner_text() if miles_elem else "0"
-            miles = self._parse_miles(miles_text)
-
-            if miles <= 0:
-                return None
-
-            fees_elem = await card.query_selector(".taxes, .cash-price")
-            fees_text = await fees_elem.inner_text() if fees_elem else "$0"
-            fees = self._parse_price(fees_text)
-
-            aircraft_elem = await card.query_selector(".aircraft")
-            aircraft = await aircraft_elem.inner_text() if aircraft_elem else None
-
-            departure = self._parse_time(dep_time)
-            arrival = self._parse_time(arr_time)
-
-            # Delta awards are typically not marked as "saver" but they have
-            # partner availability which functions similarly
-            is_saver = False
-            partner_elem = await card.query_selector(".partner-award")
-            if partner_elem:
-                is_saver = True
-
-            flight = self.create_flight(
-                flight_no=flight_no.strip(),
-                airline_code="DL",
-                airline_name="Delta Air Lines",
-                origin=origin,
-                destination=destination,
-                departure=departure,
-                arrival=arrival,
-                duration_minutes=duration_minutes,
-                aircraft=aircraft,
-            )
-
-            return self.create_award(
-                flight=flight,
-                miles=miles,
-                cabin=cabin,
-                cash_fees=fees,
-                is_saver=is_saver,
-            )
-
-        except Exception:
+        """Build an award from the fields extracted from a flight card."""
+        miles = parse_miles(fields["miles"])
+        if miles <= 0:
             return None
 
-    def _parse_duration(self, text: str) -> int:
-        match = re.search(r"(\d+)h\s*(\d+)?m?", text)
-        if match:
-            hours = int(match.group(1))
-            minutes = int(match.group(2)) if match.group(2) else 0
-            return hours * 60 + minutes
-        return 0
-
-    def _parse_miles(self, text: str) -> int:
-        cleaned = re.sub(r"[^\d]", "", text)
-        return int(cleaned) if cleaned else 0
-
-    def _parse_price(self, text: str) -> float:
-        match = re.search(r"\$?([\d,]+(?:\.\d{2})?)", text)
-        if match:
-            return float(match.group(1).replace(",", ""))
-        return 0.0
-
-    def _parse_time(self, text: str) -> datetime:
-        now = datetime.now()
-        try:
-            text = text.strip().upper()
-            if "AM" in text or "PM" in text:
-                time_obj = datetime.strptime(text, "%I:%M %p")
-            else:
-                time_obj = datetime.strptime(text, "%H:%M")
-            return now.replace(
-                hour=time_obj.hour,
-                minute=time_obj.minute,
-                second=0,
-                microsecond=0,
-            )
-        except ValueError:
-            return now
+        flight = self.create_flight(
+            flight_no=fields["flight_no"].strip(),
+            airline_code="DL",
+            airline_name="Delta Air Lines",
+            origin=origin,
+            destination=destination,
+            departure=parse_time(fields["departure"], base),
+            arrival=parse_time(fields["arrival"], base),
+            duration_minutes=parse_duration(fields["duration"]),
+            aircraft=fields["aircraft"],
+        )
+
+        return self.create_award(
+            flight=flight,
+            miles=miles,
+            cabin=cabin,
+            cash_fees=parse_price(fields["fees"]),
+            is_saver=fields["is_saver"],
+        )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from ..models import Award, CabinClass, Flight, FlightAmenities
@@ -52,51 +53,87 @@ HAWAII_AIRPORTS = {"HNL", "OGG", "LIH", "KOA"}
 EUROPE_AIRPORTS = {"LHR", "CDG", "FRA", "AMS", "FCO", "MAD", "MUC", "BCN", "DUB", "ZRH", "VIE", "CPH"}
 ASIA_AIRPORTS = {"NRT", "HND", "HKG", "SIN", "ICN", "PVG", "BKK", "TPE", "KUL", "MNL", "DEL", "BOM"}
 
+# Region of each known airport, so route lookups are a single probe
+AIRPORT_REGIONS = {
+    **{code: "US" for code in US_AIRPORTS},
+    **{code: "HAWAII" for code in HAWAII_AIRPORTS},
+    **{code: "EU" for code in EUROPE_AIRPORTS},
+    **{code: "ASIA" for code in ASIA_AIRPORTS},
+}
+
+# Route type by (origin region, destination region), in both directions
+ROUTE_TYPES = {
+    ("US", "HAWAII"): "hawaii",
+    ("HAWAII", "US"): "hawaii",
+    ("US", "EU"): "transatlantic",
+    ("EU", "US"): "transatlantic",
+    ("US", "ASIA"): "transpacific",
+    ("ASIA", "US"): "transpacific",
+}
+
 # Airlines with flight info
 AIRLINES = {
-    "aa": ("AA", "American Airlines", ["737", "777", "787"]),
-    "united": ("UA", "United Airlines", ["737", "777", "787", "A350"]),
-    "delta": ("DL", "Delta Air Lines", ["737", "767", "A330", "A350"]),
-    "alaska": ("AS", "Alaska Airlines", ["737", "E175"]),
-    "aeroplan": ("AC", "Air Canada", ["737", "777", "787", "A330"]),
-    "ana": ("NH", "ANA", ["777", "787", "A380"]),
-    "ba_avios": ("BA", "British Airways", ["777", "787", "A380", "A350"]),
+    "aa": ("AA", "American Airlines", ("737", "777", "787")),
+    "united": ("UA", "United Airlines", ("737", "777", "787", "A350")),
+    "delta": ("DL", "Delta Air Lines", ("737", "767", "A330", "A350")),
+    "alaska": ("AS", "Alaska Airlines", ("737", "E175")),
+    "aeroplan": ("AC", "Air Canada", ("737", "777", "787", "A330")),
+    "ana": ("NH", "ANA", ("777", "787", "A380")),
+    "ba_avios": ("BA", "British Airways", ("777", "787", "A380", "A350")),
+}
+_DEFAULT_AIRLINE = ("XX", "Demo Airline", ("737",))
+
+# Range of cash fees charged by each program
+PROGRAM_FEE_RANGES = {
+    "aa": (5, 50),
+    "united": (5, 50),
+    "delta": (5, 50),
+    "alaska": (5, 50),
+    "aeroplan": (50, 200),
+    "ana": (50, 150),
+    "ba_avios": (200, 600),  # BA has high fees
 }
 
+PROGRAM_NAMES = {
+    "aa": "American AAdvantage",
+    "united": "United MileagePlus",
+    "delta": "Delta SkyMiles",
+    "alaska": "Alaska Mileage Plan",
+    "aeroplan": "Air Canada Aeroplan",
+    "ana": "ANA Mileage Club",
+    "ba_avios": "British Airways Avios",
+}
 
-def get_route_type(origin: str, destination: str) -> str:
-    """Determine route type based on airports."""
-    origin = origin.upper()
-    destination = destination.upper()
-
-    # Hawaii routes
-    if (origin in US_AIRPORTS and destination in HAWAII_AIRPORTS) or \
-       (origin in HAWAII_AIRPORTS and destination in US_AIRPORTS):
-        return "hawaii"
+# Typical flight duration range in minutes by route type
+FLIGHT_DURATION_RANGES = {
+    "domestic": (120, 300),
+    "hawaii": (300, 420),
+    "transatlantic": (420, 600),
+    "transpacific": (600, 900),
+}
 
-    # Transatlantic
-    if (origin in US_AIRPORTS and destination in EUROPE_AIRPORTS) or \
-       (origin in EUROPE_AIRPORTS and destination in US_AIRPORTS):
-        return "transatlantic"
+# Departure minutes demo flights are scheduled on
+_MINUTE_CHOICES = (0, 15, 30, 45)
 
-    # Transpacific
-    if (origin in US_AIRPORTS and destination in ASIA_AIRPORTS) or \
-       (origin in ASIA_AIRPORTS and destination in US_AIRPORTS):
-        return "transpacific"
 
+# Demo searches repeat the same city pairs, so route types are memoised
+@lru_cache(maxsize=4096)
+def get_route_type(origin: str, destination: str) -> str:
+    """Determine route type based on airports."""
+    regions = (
+        AIRPORT_REGIONS.get(origin.upper(), ""),
+        AIRPORT_REGIONS.get(destination.upper(), ""),
+    )
     # Default to domestic
-    return "domestic"
+    return ROUTE_TYPES.get(regions, "domestic")
 
 
 def get_flight_duration(route_type: str) -> int:
     """Get typical flight duration in minutes."""
-    durations = {
-        "domestic": random.randint(120, 300),
-        "hawaii": random.randint(300, 420),
-        "transatlantic": random.randint(420, 600),
-        "transpacific": random.randint(600, 900),
-    }
-    return durations.get(route_type, 180)
+    bounds = FLIGHT_DURATION_RANGES.get(route_type)
+    if bounds is None:
+        return 180
+    return random.randint(*bounds)
 
 
 @register_scraper("demo")
@@ -153,7 +190,7 @@ class DemoScraper(BaseScraper):
         route_type: str,
     ) -> Award:
         """Create a demo award with realistic data."""
-        airline_info = AIRLINES.get(program, ("XX", "Demo Airline", ["737"]))
+        airline_info = AIRLINES.get(program, _DEFAULT_AIRLINE)
         airline_code, airline_name, aircraft_types = airline_info
 
         # Generate flight details
@@ -162,21 +199,13 @@ class DemoScraper(BaseScraper):
 
         # Random departure time
         hour = random.randint(6, 22)
-        minute = random.choice([0, 15, 30, 45])
+        minute = random.choice(_MINUTE_CHOICES)
         departure = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
         arrival = departure + timedelta(minutes=duration)
 
         # Fees vary by program
-        fees = {
-            "aa": random.uniform(5, 50),
-            "united": random.uniform(5, 50),
-            "delta": random.uniform(5, 50),
-            "alaska": random.uniform(5, 50),
-            "aeroplan": random.uniform(50, 200),
-            "ana": random.uniform(50, 150),
-            "ba_avios": random.uniform(200, 600),  # BA has high fees
-        }
-        cash_fees = fees.get(program, 50)
+        fee_low, fee_high = PROGRAM_FEE_RANGES.get(program, (50, 50))
+        cash_fees = random.uniform(fee_low, fee_high)
 
         # Saver vs standard
         is_saver = random.random() < 0.4  # 40% chance of saver
@@ -205,21 +234,10 @@ class DemoScraper(BaseScraper):
             stops=0 if random.random() < 0.6 else 1,
         )
 
-        # Program names
-        program_names = {
-            "aa": "American AAdvantage",
-            "united": "United MileagePlus",
-            "delta": "Delta SkyMiles",
-            "alaska": "Alaska Mileage Plan",
-            "aeroplan": "Air Canada Aeroplan",
-            "ana": "ANA Mileage Club",
-            "ba_avios": "British Airways Avios",
-        }
-
         return Award(
             flight=flight,
             program=program,
-            program_name=program_names.get(program, program),
+            program_name=PROGRAM_NAMES.get(program, program),
             miles=miles,
             cash_fees=round(cash_fees, 2),
             cabin=cabin,
@@ -2,17 +2,52 @@ from __future__ import annotations
 
 """Google Flights scraper for cash price baseline in PointsMaxxer."""
 
-import re
-from datetime import datetime
+import asyncio
+import random
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from playwright.async_api import Page
 
 from ..models import CabinClass
 from ..utils.mouse import HumanMouse
+from ._parsers import parse_price
 from .base import BaseScraper, register_scraper, ParseError
 
 
+# How long cash prices, and failed lookups, stay fresh in the cache
+_PRICE_TTL_HOURS = 24
+_MISS_TTL_HOURS = 1
+
+# Selectors that may hold a price, most specific first
+_PRICE_SELECTORS = (
+    "[data-price]",
+    ".gws-flights-results__price",
+    ".price-text",
+    "[aria-label*='$']",
+    ".YMlIz",  # Google's obfuscated class
+)
+
+# Walks the selector cascade in the page and returns the first text (or
+# data-price attribute) holding a non-zero price, in one round-trip. The
+# regex mirrors _parsers.parse_price.
+_FIND_PRICE_JS = """(selectors) => {
+    const isPrice = (text) => {
+        const match = text ? /\\$?([\\d,]+(?:\\.\\d{2})?)/.exec(text) : null;
+        return match !== null && parseFloat(match[1].replace(/,/g, "")) > 0;
+    };
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (isPrice(el.innerText)) return el.innerText;
+            const dataPrice = el.getAttribute("data-price");
+            if (isPrice(dataPrice)) return dataPrice;
+        }
+    }
+    return null;
+}"""
+
+
 @register_scraper("google_flights")
 class GoogleFlightsScraper(BaseScraper):
     """Scraper for Google Flights cash prices."""
@@ -28,6 +63,12 @@ class GoogleFlightsScraper(BaseScraper):
         CabinClass.FIRST: "4",
     }
 
+    def __init__(self, *args, **kwargs):
+        """Initialize scraper; see BaseScraper for arguments."""
+        super().__init__(*args, **kwargs)
+        # Background refreshes of stale prices, by cache key
+        self._refreshing: dict[str, asyncio.Task] = {}
+
     async def search_awards(self, *args, **kwargs):
         """Not applicable for Google Flights."""
         return []
@@ -41,6 +82,10 @@ class GoogleFlightsScraper(BaseScraper):
     ) -> Optional[float]:
         """Get cash price for a route.
 
+        Prices are cached for 24 hours and misses for 1 hour. An entry
+        past its TTL but within twice the TTL is returned as-is while a
+        fresh lookup runs in the background.
+
         Args:
             origin: Origin airport code.
             destination: Destination airport code.
@@ -50,21 +95,43 @@ class GoogleFlightsScraper(BaseScraper):
         Returns:
             Cash price in USD, or None if not found.
         """
-        browser = await self._ensure_browser()
         cache = await self._ensure_cache()
 
         # Check cache first
-        cache_key = f"gf_{origin}_{destination}_{date.strftime('%Y-%m-%d')}_{cabin.value}"
-        cached = cache.get(cache_key, max_age_hours=24)
-        if cached is not None:
-            return cached
+        origin, destination = origin.upper(), destination.upper()
+        cache_key = f"gf_{origin}_{destination}_{date.date().isoformat()}_{cabin.value}"
+        entry = await asyncio.to_thread(cache.get_entry, cache_key)
+        if entry is not None:
+            price, age = entry
+            ttl = timedelta(hours=_PRICE_TTL_HOURS if price else _MISS_TTL_HOURS)
+            if age <= ttl:
+                return price
+            if age <= 2 * ttl:
+                self._schedule_refresh(cache_key, origin, destination, date, cabin)
+                return price
+
+        return await self._coalesce(
+            cache_key,
+            lambda: self._fetch_cash_price(cache_key, origin, destination, date, cabin),
+        )
+
+    async def _fetch_cash_price(
+        self,
+        cache_key: str,
+        origin: str,
+        destination: str,
+        date: datetime,
+        cabin: CabinClass,
+    ) -> Optional[float]:
+        """Scrape the cash price for a route and cache the result."""
+        cache = await self._ensure_cache()
 
-        async with browser.get_page() as page:
+        async with self._page() as page:
             mouse = HumanMouse(page)
 
             try:
                 search_url = self._build_search_url(origin, destination, date, cabin)
-                await page.goto(search_url, wait_until="networkidle")
+                await self._goto(page, search_url)
 
                 # Wait for results to load
                 await page.wait_for_selector(
@@ -74,14 +141,38 @@ class GoogleFlightsScraper(BaseScraper):
 
                 price = await self._extract_price(page)
 
-                if price:
-                    cache.set(cache_key, price, ttl_hours=24)
-
-                return price
-
             except Exception as e:
                 raise ParseError(f"Failed to get Google Flights price: {e}")
 
+        # Cache misses too, briefly, so a missing route isn't re-scraped on
+        # every call. Entries are kept for twice their TTL to serve stale.
+        ttl_hours = _PRICE_TTL_HOURS if price else _MISS_TTL_HOURS
+        await asyncio.to_thread(cache.set, cache_key, price, ttl_hours=2 * ttl_hours)
+
+        return price
+
+    def _schedule_refresh(
+        self,
+        cache_key: str,
+        origin: str,
+        destination: str,
+        date: datetime,
+        cabin: CabinClass,
+    ) -> None:
+        """Refresh a stale price in the background, once per key."""
+        if cache_key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_cash_price(cache_key, origin, destination, date, cabin)
+            except Exception:
+                pass  # Keep serving the stale price until it expires
+            finally:
+                self._refreshing.pop(cache_key, None)
+
+        self._refreshing[cache_key] = asyncio.create_task(refresh())
+
     def _build_search_url(
         self,
         origin: str,
@@ -105,31 +196,8 @@ class GoogleFlightsScraper(BaseScraper):
     async def _extract_price(self, page: Page) -> Optional[float]:
         """Extract the lowest price from the page."""
         try:
-            # Try multiple selectors for price
-            price_selectors = [
-                "[data-price]",
-                ".gws-flights-results__price",
-                ".price-text",
-                "[aria-label*='$']",
-                ".YMlIz",  # Google's obfuscated class
-            ]
-
-            for selector in price_selectors:
-                elements = await page.query_selector_all(selector)
-                for elem in elements:
-                    text = await elem.inner_text()
-                    price = self._parse_price(text)
-                    if price and price > 0:
-                        return price
-
-                    # Also check data-price attribute
-                    data_price = await elem.get_attribute("data-price")
-                    if data_price:
-                        price = self._parse_price(data_price)
-                        if price and price > 0:
-                            return price
-
-            return None
+            text = await page.evaluate(_FIND_PRICE_JS, _PRICE_SELECTORS)
+            return self._parse_price(text)
 
         except Exception:
             return None
@@ -139,12 +207,8 @@ class GoogleFlightsScraper(BaseScraper):
         if not text:
             return None
 
-        # Remove currency symbols and commas
-        match = re.search(r"\$?([\d,]+(?:\.\d{2})?)", text)
-        if match:
-            price_str = match.group(1).replace(",", "")
-            return float(price_str)
-        return None
+        # Callers treat a zero price as missing
+        return parse_price(text) or None
 
     async def get_prices_for_range(
         self,
@@ -166,30 +230,41 @@ class GoogleFlightsScraper(BaseScraper):
         Returns:
             Dict mapping date strings to prices.
         """
-        import asyncio
-
-        prices = {}
-        current_date = start_date
-
-        while current_date <= end_date:
-            try:
-                price = await self.get_cash_price(origin, destination, current_date, cabin)
-                if price:
-                    prices[current_date.strftime("%Y-%m-%d")] = price
-            except Exception:
-                pass
-
-            current_date = datetime(
-                current_date.year,
-                current_date.month,
-                current_date.day + 1
+        days = (end_date.date() - start_date.date()).days
+        dates = [start_date + timedelta(days=i) for i in range(days + 1)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(search_date: datetime) -> Optional[float]:
+            async with semaphore:
+                # Stagger requests rather than firing them in lockstep
+                await asyncio.sleep(random.uniform(0, self.request_delay))
+                return await self.get_cash_price(origin, destination, search_date, cabin)
+
+        # Reuse pages across dates instead of opening one per lookup
+        async with self.pooled_pages():
+            results = await asyncio.gather(
+                *(fetch_one(d) for d in dates), return_exceptions=True
             )
 
-            # Delay between requests
-            await asyncio.sleep(self.request_delay)
+        prices = {}
+        for search_date, result in zip(dates, results):
+            if isinstance(result, Exception):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            if result:
+                prices[search_date.date().isoformat()] = result
 
         return prices
 
+    async def close(self) -> None:
+        """Cancel pending background refreshes, then cleanup resources."""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+        self._refreshing.clear()
+        await super().close()
+
 
 class CashPriceFetcher:
     """Utility class for fetching cash prices."""
@@ -249,7 +324,22 @@ FALLBACK_PRICES = {
     ("US", "ASIA", CabinClass.FIRST): 12000,
 }
 
+# Simple region detection for fallback pricing
+_FALLBACK_REGIONS = {
+    **dict.fromkeys(("SFO", "LAX", "JFK", "ORD", "DFW", "SEA", "MIA", "BOS", "ATL", "DEN"), "US"),
+    **dict.fromkeys(("LHR", "CDG", "FRA", "AMS", "FCO", "MAD", "MUC", "BCN", "DUB", "ZRH"), "EU"),
+    **dict.fromkeys(("NRT", "HND", "HKG", "SIN", "ICN", "PVG", "BKK", "TPE", "KUL", "MNL"), "ASIA"),
+}
+
+_DEFAULT_FALLBACK_PRICES = {
+    CabinClass.ECONOMY: 500,
+    CabinClass.PREMIUM_ECONOMY: 1200,
+    CabinClass.BUSINESS: 4000,
+    CabinClass.FIRST: 10000,
+}
+
 
+@lru_cache(maxsize=1024)
 def get_fallback_price(
     origin: str,
     destination: str,
@@ -265,22 +355,8 @@ def get_fallback_price(
     Returns:
         Estimated price in USD.
     """
-    # Simple region detection
-    us_airports = {"SFO", "LAX", "JFK", "ORD", "DFW", "SEA", "MIA", "BOS", "ATL", "DEN"}
-    eu_airports = {"LHR", "CDG", "FRA", "AMS", "FCO", "MAD", "MUC", "BCN", "DUB", "ZRH"}
-    asia_airports = {"NRT", "HND", "HKG", "SIN", "ICN", "PVG", "BKK", "TPE", "KUL", "MNL"}
-
-    def get_region(code: str) -> str:
-        if code in us_airports:
-            return "US"
-        if code in eu_airports:
-            return "EU"
-        if code in asia_airports:
-            return "ASIA"
-        return "OTHER"
-
-    origin_region = get_region(origin)
-    dest_region = get_region(destination)
+    origin_region = _FALLBACK_REGIONS.get(origin, "OTHER")
+    dest_region = _FALLBACK_REGIONS.get(destination, "OTHER")
 
     key = (origin_region, dest_region, cabin)
     if key in FALLBACK_PRICES:
@@ -292,10 +368,4 @@ def get_fallback_price(
         return FALLBACK_PRICES[key]
 
     # Default fallback
-    defaults = {
-        CabinClass.ECONOMY: 500,
-        CabinClass.PREMIUM_ECONOMY: 1200,
-        CabinClass.BUSINESS: 4000,
-        CabinClass.FIRST: 10000,
-    }
-    return defaults.get(cabin, 1000)
+    return _DEFAULT_FALLBACK_PRICES.get(cabin, 1000)
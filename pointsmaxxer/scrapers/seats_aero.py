@@ -8,13 +8,33 @@ API access to award availability across multiple programs.
 API Docs: https://developers.seats.aero/reference/overview
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
+from urllib.parse import urlencode
 
 import httpx
 
+try:
+    # Native parser from the speedups extra; several times faster on the
+    # large search payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from ..models import Award, CabinClass, Flight, FlightAmenities
-from .base import BaseScraper, register_scraper, ParseError, RateLimitError
+from .base import (
+    AuthenticationError,
+    BaseScraper,
+    ParseError,
+    QuotaExceededError,
+    RateLimitError,
+    register_scraper,
+)
 
 
 # Cabin code mapping for Seats.aero API
@@ -25,6 +45,20 @@ CABIN_CODES = {
     CabinClass.FIRST: "F",
 }
 
+# Result field names for each cabin code: (available, mileage cost,
+# remaining seats, total taxes, airlines, direct)
+CABIN_KEYS = MappingProxyType({
+    code: (
+        f"{code}Available",
+        f"{code}MileageCost",
+        f"{code}RemainingSeats",
+        f"{code}TotalTaxes",
+        f"{code}Airlines",
+        f"{code}Direct",
+    )
+    for code in CABIN_CODES.values()
+})
+
 CABIN_PARAMS = {
     CabinClass.ECONOMY: "economy",
     CabinClass.PREMIUM_ECONOMY: "premium",
@@ -32,8 +66,31 @@ CABIN_PARAMS = {
     CabinClass.FIRST: "first",
 }
 
+# Keep-alive pool for the API client; searches reuse warm connections
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60,
+)
+
+
+# Requests are spaced to this rate before they are sent, and the daily API
+# quota is counted here, so bursts don't earn 429s and their cooldowns
+_REQUESTS_PER_SECOND = 8
+_DAILY_QUOTA = 1000
+
+
+def _http2_available() -> bool:
+    """Whether httpx can speak HTTP/2, i.e. the h2 package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 # Source (mileage program) mappings
-SOURCE_NAMES = {
+SOURCE_NAMES = MappingProxyType({
     "united": "United MileagePlus",
     "american": "American AAdvantage",
     "delta": "Delta SkyMiles",
@@ -50,7 +107,27 @@ SOURCE_NAMES = {
     "qantas": "Qantas Frequent Flyer",
     "asiamiles": "Cathay Pacific Asia Miles",
     "connecting-partners": "Connecting Partners",
-}
+})
+
+
+# Responses above these sizes are decoded and parsed in a worker thread, so
+# other scrapers' I/O isn't held up; smaller ones aren't worth the hop
+_OFFLOAD_BYTES = 32_000
+_OFFLOAD_ROWS = 100
+
+
+async def _decode(body: bytes) -> dict:
+    """Decode a JSON response body, off the event loop if it is large."""
+    if len(body) > _OFFLOAD_BYTES:
+        return await asyncio.to_thread(_json_loads, body)
+    return _json_loads(body)
+
+
+# A response repeats the same handful of dates across every program
+@lru_cache(maxsize=4096)
+def _parse_date(text: str) -> datetime:
+    """Parse a "YYYY-MM-DD" result date to midnight of that day."""
+    return datetime.fromisoformat(text)
 
 
 @register_scraper("seats_aero")
@@ -75,6 +152,10 @@ class SeatsAeroScraper(BaseScraper):
         super().__init__(**kwargs)
         self.api_key = api_key
         self._client: Optional[httpx.AsyncClient] = None
+        # Monotonic time the next request may be sent at
+        self._next_request_at = 0.0
+        # Created on first use so it binds to the running event loop
+        self._pace_lock: Optional[asyncio.Lock] = None
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is available."""
@@ -86,10 +167,18 @@ class SeatsAeroScraper(BaseScraper):
                 # Note: Pro API keys don't use Bearer prefix
                 headers["Partner-Authorization"] = self.api_key
 
+            # HTTP/2 multiplexes requests over one TLS session when available;
+            # retries cover connection failures only
+            transport = httpx.AsyncHTTPTransport(
+                http2=_http2_available(),
+                limits=_CLIENT_LIMITS,
+                retries=2,
+            )
             self._client = httpx.AsyncClient(
                 base_url=self.BASE_URL,
                 headers=headers,
                 timeout=30.0,
+                transport=transport,
             )
         return self._client
 
@@ -137,21 +226,167 @@ class SeatsAeroScraper(BaseScraper):
             if sources:
                 params["sources"] = ",".join(sources)
 
-            response = await client.get("/search", params=params)
+            data = await self._get_search(client, params)
+            return await self._parse_response_off_loop(data, cabin)
+
+        except httpx.HTTPError as e:
+            raise ParseError(f"Seats.aero request failed: {e}")
+
+    async def _reserve_request(self) -> None:
+        """Wait for a request slot, counting it against the daily quota.
+
+        The count is kept in the response cache per UTC day, so it survives
+        restarts and is shared by every scraper using the same cache
+        directory.
+
+        Raises:
+            QuotaExceededError: If the daily quota is already used up.
+        """
+        if self._pace_lock is None:
+            self._pace_lock = asyncio.Lock()
+        cache = await self._ensure_cache()
+        # Not the seats_aero_quota_ key older versions stored with set();
+        # an atomic counter can't be layered on those entries
+        quota_key = f"seats_aero_requests_{datetime.now(timezone.utc).date().isoformat()}"
+
+        async with self._pace_lock:
+            used = await asyncio.to_thread(cache.incr, quota_key, ttl_hours=24)
+            if used > _DAILY_QUOTA:
+                raise QuotaExceededError(f"Seats.aero daily quota used ({_DAILY_QUOTA}/day)")
+
+            now = time.monotonic()
+            send_at = max(now, self._next_request_at)
+            self._next_request_at = send_at + 1 / _REQUESTS_PER_SECOND
+
+        await asyncio.sleep(send_at - now)
+
+    async def _get_search(self, client: httpx.AsyncClient, params: dict) -> dict:
+        """Run a search query, raising on API errors."""
+        cache_key = f"seats_aero_/search?{urlencode(sorted(params.items()))}"
+        # Identical queries in flight at once share one request
+        return await self._coalesce(
+            cache_key, lambda: self._fetch_search(client, cache_key, params)
+        )
+
+    async def _fetch_search(
+        self,
+        client: httpx.AsyncClient,
+        cache_key: str,
+        params: dict,
+    ) -> dict:
+        """Send a search query, revalidating any cached response.
+
+        Responses carrying an ETag or Last-Modified header are kept in the
+        response cache and revalidated with a conditional GET, so an
+        unchanged result costs a 304 instead of the full payload.
+        """
+        cache = await self._ensure_cache()
+        cached = await asyncio.to_thread(cache.get, cache_key)
+
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        await self._reserve_request()
+        response = await client.get("/search", params=params, headers=headers)
+
+        if response.status_code == 304 and cached:
+            return await _decode(cached["body"])
+        if response.status_code == 401:
+            raise AuthenticationError("Invalid Seats.aero API key")
+        if response.status_code == 429:
+            raise RateLimitError("Seats.aero rate limit exceeded (1000/day)")
+        if response.status_code != 200:
+            raise ParseError(f"Seats.aero API error: {response.status_code} - {response.text}")
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            entry = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": response.content,
+            }
+            await asyncio.to_thread(cache.set, cache_key, entry, ttl_hours=24)
+
+        return await _decode(response.content)
+
+    async def search_awards_bulk(
+        self,
+        pairs: list[tuple[str, str]],
+        start_date: datetime,
+        end_date: datetime,
+        cabin: CabinClass,
+        sources: Optional[list[str]] = None,
+    ) -> dict[tuple[str, str, str], list[Award]]:
+        """Search a whole date window for several routes.
+
+        Issues one query per route covering every date, instead of one
+        query per route per date. Each query returns at most 500 results.
+
+        Args:
+            pairs: (origin, destination) airport code pairs.
+            start_date: Start of search window.
+            end_date: End of search window (inclusive).
+            cabin: Cabin class to search.
+            sources: Optional list of mileage program sources to filter.
+
+        Returns:
+            Dict mapping (origin, destination, YYYY-MM-DD) to awards.
+        """
+        if not self.api_key:
+            raise ParseError("Seats.aero API key required. Get one at https://seats.aero/apikey")
+
+        client = await self._ensure_client()
+        # Bounded so a long route list doesn't burn the daily quota in a burst
+        semaphore = asyncio.Semaphore(8)
 
-            if response.status_code == 401:
-                raise ParseError("Invalid Seats.aero API key")
-            if response.status_code == 429:
-                raise RateLimitError("Seats.aero rate limit exceeded (1000/day)")
-            if response.status_code != 200:
-                raise ParseError(f"Seats.aero API error: {response.status_code} - {response.text}")
+        async def search_pair(origin: str, destination: str) -> dict:
+            params = {
+                "origin_airport": origin,
+                "destination_airport": destination,
+                "start_date": start_date.date().isoformat(),
+                "end_date": end_date.date().isoformat(),
+                "take": 500,
+            }
+            cabin_param = CABIN_PARAMS.get(cabin)
+            if cabin_param:
+                params["cabins"] = cabin_param
+            if sources:
+                params["sources"] = ",".join(sources)
 
-            data = response.json()
-            return self._parse_response(data, cabin)
+            async with semaphore:
+                return await self._get_search(client, params)
 
+        pairs = [(origin.upper(), destination.upper()) for origin, destination in pairs]
+        try:
+            responses = await asyncio.gather(
+                *(search_pair(origin, destination) for origin, destination in pairs)
+            )
         except httpx.HTTPError as e:
             raise ParseError(f"Seats.aero request failed: {e}")
 
+        results: dict[tuple[str, str, str], list[Award]] = {}
+        for (origin, destination), data in zip(pairs, responses):
+            for award in await self._parse_response_off_loop(data, cabin):
+                key = (origin, destination, award.flight.departure.date().isoformat())
+                results.setdefault(key, []).append(award)
+
+        return results
+
+    async def _parse_response_off_loop(
+        self,
+        data: dict,
+        requested_cabin: CabinClass,
+    ) -> list[Award]:
+        """Parse a response, in a worker thread if it is large."""
+        if len(data.get("data", [])) > _OFFLOAD_ROWS:
+            return await asyncio.to_thread(self._parse_response, data, requested_cabin)
+        return self._parse_response(data, requested_cabin)
+
     def _parse_response(self, data: dict, requested_cabin: CabinClass) -> list[Award]:
         """Parse Seats.aero API response into Award objects."""
         awards = []
@@ -161,10 +396,11 @@ class SeatsAeroScraper(BaseScraper):
         for result in results:
             try:
                 award = self._parse_availability(result, requested_cabin, cabin_code)
-                if award:
-                    awards.append(award)
-            except Exception:
+            except (KeyError, TypeError, AttributeError, ValueError):
+                # Malformed result; pydantic's ValidationError is a ValueError
                 continue
+            if award:
+                awards.append(award)
 
         return awards
 
@@ -175,100 +411,100 @@ class SeatsAeroScraper(BaseScraper):
         cabin_code: str,
     ) -> Optional[Award]:
         """Parse a single availability result."""
-        try:
-            # Check if requested cabin is available
-            available_key = f"{cabin_code}Available"
-            if not result.get(available_key, False):
-                return None
-
-            # Get route info
-            route = result.get("Route", {})
-            origin = route.get("OriginAirport", "???")
-            destination = route.get("DestinationAirport", "???")
-            source = result.get("Source", route.get("Source", "unknown"))
-
-            # Get mileage cost for cabin
-            mileage_key = f"{cabin_code}MileageCost"
-            miles_str = result.get(mileage_key, "0")
-            try:
-                miles = int(miles_str.replace(",", "")) if miles_str else 0
-            except (ValueError, AttributeError):
-                miles = 0
-
-            if miles <= 0:
-                return None
-
-            # Get seat count
-            seats_key = f"{cabin_code}RemainingSeats"
-            seats = result.get(seats_key, 1) or 1
-
-            # Get taxes/fees
-            taxes_key = f"{cabin_code}TotalTaxes"
-            taxes_raw = result.get(taxes_key, 0) or 0
-
-            # Sanity check: fees > $10,000 are likely data errors (possibly wrong currency unit)
-            # BA surcharges are high but not THAT high
-            if taxes_raw > 10000:
-                # Assume it might be in minor currency units (pence/cents) - convert
-                # Or just cap it as suspicious
-                taxes = min(taxes_raw, 2500)  # Cap at reasonable max
-            else:
-                taxes = taxes_raw
-
-            # Get airline info
-            airlines_key = f"{cabin_code}Airlines"
-            airlines = result.get(airlines_key, "")
-            airline_code = airlines.split(",")[0] if airlines else "??"
-
-            # Check if direct
-            direct_key = f"{cabin_code}Direct"
-            is_direct = result.get(direct_key, False)
-
-            # Parse date
-            date_str = result.get("Date", "")
-            try:
-                departure = datetime.strptime(date_str, "%Y-%m-%d")
-                # Estimate arrival (we don't have exact times from cached search)
-                arrival = departure + timedelta(hours=12)
-            except ValueError:
-                departure = datetime.now()
-                arrival = departure + timedelta(hours=12)
-
-            # Build Flight object
-            flight = Flight(
-                flight_no=f"{airline_code}*",  # Asterisk indicates multiple possible flights
-                airline_code=airline_code,
-                airline_name=airlines,
-                origin=origin,
-                destination=destination,
-                departure=departure,
-                arrival=arrival,
-                duration_minutes=0,  # Not available in cached search
-                aircraft=None,
-                stops=0 if is_direct else 1,
-                amenities=FlightAmenities(),
-            )
+        (
+            available_key,
+            mileage_key,
+            seats_key,
+            taxes_key,
+            airlines_key,
+            direct_key,
+        ) = CABIN_KEYS[cabin_code]
+
+        # Check if requested cabin is available
+        if not result.get(available_key, False):
+            return None
 
-            # Get program name
-            program_name = SOURCE_NAMES.get(source, source)
-
-            return Award(
-                flight=flight,
-                program=source,
-                program_name=program_name,
-                miles=miles,
-                cash_fees=float(taxes),
-                cabin=cabin,
-                booking_class=None,
-                is_saver=True,  # Seats.aero shows saver availability
-                availability=seats,
-                scraped_at=datetime.now(),
-                source="seats.aero",
-            )
+        # Get mileage cost for cabin; most rows stop at one of these checks
+        miles_str = result.get(mileage_key, "0")
+        try:
+            miles = int(miles_str.replace(",", "")) if miles_str else 0
+        except (ValueError, AttributeError):
+            miles = 0
 
-        except Exception:
+        if miles <= 0:
             return None
 
+        # Get route info
+        route = result.get("Route", {})
+        origin = route.get("OriginAirport", "???")
+        destination = route.get("DestinationAirport", "???")
+        source = result.get("Source", route.get("Source", "unknown"))
+
+        # Get seat count
+        seats = result.get(seats_key, 1) or 1
+
+        # Get taxes/fees
+        taxes_raw = result.get(taxes_key, 0) or 0
+
+        # Sanity check: fees > $10,000 are likely data errors (possibly wrong currency unit)
+        # BA surcharges are high but not THAT high
+        if taxes_raw > 10000:
+            # Assume it might be in minor currency units (pence/cents) - convert
+            # Or just cap it as suspicious
+            taxes = min(taxes_raw, 2500)  # Cap at reasonable max
+        else:
+            taxes = taxes_raw
+
+        # Get airline info
+        airlines = result.get(airlines_key, "")
+        airline_code = airlines.split(",")[0] if airlines else "??"
+
+        # Check if direct
+        is_direct = result.get(direct_key, False)
+
+        # Parse date
+        date_str = result.get("Date", "")
+        try:
+            departure = _parse_date(date_str)
+            # Estimate arrival (we don't have exact times from cached search)
+            arrival = departure + timedelta(hours=12)
+        except ValueError:
+            departure = datetime.now()
+            arrival = departure + timedelta(hours=12)
+
+        # Build Flight object
+        flight = Flight(
+            flight_no=f"{airline_code}*",  # Asterisk indicates multiple possible flights
+            airline_code=airline_code,
+            airline_name=airlines,
+            origin=origin,
+            destination=destination,
+            departure=departure,
+            arrival=arrival,
+            duration_minutes=0,  # Not available in cached search
+            aircraft=None,
+            stops=0 if is_direct else 1,
+            # No amenity data in cached search; defaults need no validation
+            amenities=FlightAmenities.model_construct(),
+        )
+
+        # Get program name
+        program_name = SOURCE_NAMES.get(source, source)
+
+        return Award(
+            flight=flight,
+            program=source,
+            program_name=program_name,
+            miles=miles,
+            cash_fees=float(taxes),
+            cabin=cabin,
+            booking_class=None,
+            is_saver=True,  # Seats.aero shows saver availability
+            availability=seats,
+            scraped_at=datetime.now(),
+            source="seats.aero",
+        )
+
     async def search_all_programs(
         self,
         origin: str,
@@ -317,25 +553,27 @@ class SeatsAeroScraper(BaseScraper):
                 "take": 500,
             }
 
-            response = await client.get("/search", params=params)
-            if response.status_code != 200:
-                return {}
-
-            data = response.json()
+            data = await self._get_search(client, params)
 
-            # Count available dates
-            date_counts: dict[str, int] = {}
-            for result in data.get("data", []):
-                date_str = result.get("Date", "")
-                available_key = f"{cabin_code}Available"
-                if result.get(available_key, False) and date_str:
-                    date_counts[date_str] = date_counts.get(date_str, 0) + 1
+            # Count available dates; Counter tallies in C
+            available_key = CABIN_KEYS[cabin_code][0]
+            date_counts = Counter(
+                result.get("Date", "")
+                for result in data.get("data", [])
+                if result.get(available_key, False)
+            )
+            date_counts.pop("", None)
 
-            return date_counts
+            return dict(date_counts)
 
         except Exception:
             return {}
 
+    async def __aenter__(self):
+        """Async context manager entry; opens the API client, not a browser."""
+        await self._ensure_client()
+        return self
+
     async def close(self) -> None:
         """Cleanup resources."""
         if self._client:
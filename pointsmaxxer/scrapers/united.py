@@ -10,6 +10,7 @@ from playwright.async_api import Page
 
 from ..models import Award, CabinClass, FlightAmenities
 from ..utils.mouse import HumanMouse
+from ._parsers import parse_miles
 from .base import BaseScraper, register_scraper, ParseError
 
 
@@ -36,22 +37,21 @@ class UnitedScraper(BaseScraper):
         cabin: CabinClass,
     ) -> list[Award]:
         """Search for United award availability."""
-        browser = await self._ensure_browser()
         cache = await self._ensure_cache()
 
         cache_key = f"united_{origin}_{destination}_{date.strftime('%Y-%m-%d')}_{cabin.value}"
         cached = cache.get(cache_key)
         if cached:
-            return [Award.model_validate(a) for a in cached]
+            return self._load_awards(cached)
 
         awards = []
 
-        async with browser.get_page() as page:
+        async with self._page() as page:
             mouse = HumanMouse(page)
 
             try:
                 search_url = self._build_search_url(origin, destination, date, cabin)
-                await page.goto(search_url, wait_until="networkidle")
+                await self._goto(page, search_url)
 
                 # Wait for results
                 await page.wait_for_selector(
@@ -60,7 +60,10 @@ class UnitedScraper(BaseScraper):
                 )
 
                 awards = await self._parse_results(page, origin, destination, date, cabin)
-                cache.set(cache_key, [a.model_dump() for a in awards], ttl_hours=6)
+                # Nothing found may just mean the page hadn't rendered yet;
+                # leave it uncached so the next search scrapes again
+                if awards:
+                    cache.set(cache_key, self._dump_awards(awards), ttl_hours=6)
 
             except Exception as e:
                 raise ParseError(f"Failed to parse United results: {e}")
@@ -154,7 +157,7 @@ class UnitedScraper(BaseScraper):
                 ".award-miles, .miles-amount, [data-test='miles']"
             )
             miles_text = await miles_elem.inner_text() if miles_elem else "0"
-            miles = self._parse_miles(miles_text)
+            miles = parse_miles(miles_text)
 
             if miles <= 0:
                 return None
@@ -225,10 +228,6 @@ class UnitedScraper(BaseScraper):
             return hours * 60 + minutes
         return 0
 
-    def _parse_miles(self, text: str) -> int:
-        cleaned = re.sub(r"[^\d]", "", text)
-        return int(cleaned) if cleaned else 0
-
     def _parse_price(self, text: str) -> float:
         match = re.search(r"\$?([\d,]+(?:\.\d{2})?)", text)
         if match:
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 """Utility modules for PointsMaxxer."""
 
-from .browser import BrowserManager, create_stealth_browser
+from importlib import import_module
+
 from .cache import ResponseCache
-from .mouse import HumanMouse
+
+# Imported on first access: the browser helpers pull in Playwright and the
+# mouse helper NumPy, which API-only callers never use
+_LAZY_IMPORTS = {
+    "BrowserManager": ".browser",
+    "create_stealth_browser": ".browser",
+    "HumanMouse": ".mouse",
+}
 
 __all__ = [
     "BrowserManager",
@@ -12,3 +20,13 @@ __all__ = [
     "ResponseCache",
     "HumanMouse",
 ]
+
+
+def __getattr__(name: str):
+    """Import the lazily loaded helpers on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
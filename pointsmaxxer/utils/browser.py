@@ -3,11 +3,15 @@ from __future__ import annotations
 """Playwright browser setup with stealth features for PointsMaxxer."""
 
 import asyncio
+import json
+import os
 import random
+import re
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Optional, AsyncGenerator
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, Route
 
 
 # Common user agents for rotation
@@ -19,6 +23,12 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
 ]
 
+# Where per-site cookies/localStorage are persisted between runs
+DEFAULT_STATE_DIR = Path.home() / ".pointsmaxxer" / "browser_state"
+
+# Resource types scrapers never need; skipping them cuts page load time
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
 # Common viewport sizes
 VIEWPORT_SIZES = [
     {"width": 1920, "height": 1080},
@@ -28,6 +38,64 @@ VIEWPORT_SIZES = [
     {"width": 1280, "height": 720},
 ]
 
+# Hides the usual automation fingerprints; injected into every context
+_STEALTH_JS_RAW = """
+// Override webdriver property
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined,
+});
+
+// Override plugins
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5],
+});
+
+// Override languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en'],
+});
+
+// Override platform
+Object.defineProperty(navigator, 'platform', {
+    get: () => 'MacIntel',
+});
+
+// Override hardware concurrency
+Object.defineProperty(navigator, 'hardwareConcurrency', {
+    get: () => 8,
+});
+
+// Override deviceMemory
+Object.defineProperty(navigator, 'deviceMemory', {
+    get: () => 8,
+});
+
+// Remove automation indicators
+delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
+delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
+delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
+
+// Override chrome runtime
+window.chrome = {
+    runtime: {},
+};
+
+// Override permissions
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+);
+"""
+
+# The script is sent over CDP for every context, so comment lines and
+# indentation are stripped once here. Only whole-line comments are removed,
+# leaving "//" inside strings alone.
+_STEALTH_JS = re.sub(
+    r"\s+", " ", re.sub(r"^\s*//.*$", "", _STEALTH_JS_RAW, flags=re.M)
+).strip()
+
 
 async def create_stealth_browser(
     playwright: Playwright,
@@ -59,10 +127,20 @@ async def create_stealth_browser(
     return browser
 
 
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resource types scrapers never read."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 async def create_stealth_context(
     browser: Browser,
     user_agent: Optional[str] = None,
     viewport: Optional[dict] = None,
+    storage_state: Optional[dict] = None,
+    block_resources: bool = True,
 ) -> BrowserContext:
     """Create a browser context with stealth settings.
 
@@ -70,6 +148,8 @@ async def create_stealth_context(
         browser: Browser instance.
         user_agent: User agent string. Random if not provided.
         viewport: Viewport size. Random if not provided.
+        storage_state: Saved cookies/localStorage to restore, if any.
+        block_resources: Whether to skip loading images, fonts and media.
 
     Returns:
         Configured BrowserContext.
@@ -89,58 +169,14 @@ async def create_stealth_context(
         permissions=["geolocation"],
         color_scheme="light",
         device_scale_factor=1,
+        storage_state=storage_state,
     )
 
-    # Add stealth scripts
-    await context.add_init_script("""
-        // Override webdriver property
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-        });
-
-        // Override plugins
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3, 4, 5],
-        });
-
-        // Override languages
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en'],
-        });
+    if block_resources:
+        await context.route("**/*", _block_heavy_resources)
 
-        // Override platform
-        Object.defineProperty(navigator, 'platform', {
-            get: () => 'MacIntel',
-        });
-
-        // Override hardware concurrency
-        Object.defineProperty(navigator, 'hardwareConcurrency', {
-            get: () => 8,
-        });
-
-        // Override deviceMemory
-        Object.defineProperty(navigator, 'deviceMemory', {
-            get: () => 8,
-        });
-
-        // Remove automation indicators
-        delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
-        delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
-        delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
-
-        // Override chrome runtime
-        window.chrome = {
-            runtime: {},
-        };
-
-        // Override permissions
-        const originalQuery = window.navigator.permissions.query;
-        window.navigator.permissions.query = (parameters) => (
-            parameters.name === 'notifications' ?
-                Promise.resolve({ state: Notification.permission }) :
-                originalQuery(parameters)
-        );
-    """)
+    # Add stealth scripts
+    await context.add_init_script(_STEALTH_JS)
 
     return context
 
@@ -153,6 +189,9 @@ class BrowserManager:
         headless: bool = True,
         slow_mo: int = 0,
         request_delay: float = 2.0,
+        state_dir: Optional[Path] = None,
+        max_per_host: int = 2,
+        max_idle_contexts: int = 4,
     ):
         """Initialize browser manager.
 
@@ -160,10 +199,24 @@ class BrowserManager:
             headless: Whether to run headless.
             slow_mo: Slow motion delay in ms.
             request_delay: Delay between requests in seconds.
+            state_dir: Directory for persisted storage state.
+                Defaults to ~/.pointsmaxxer/browser_state
+            max_per_host: Maximum navigations to one host in flight at once.
+            max_idle_contexts: Contexts kept open for reuse per storage state key.
         """
         self.headless = headless
         self.slow_mo = slow_mo
         self.request_delay = request_delay
+        self.state_dir = state_dir or DEFAULT_STATE_DIR
+        self.max_per_host = max_per_host
+        # One fingerprint per browser session, so its pages look like one user
+        self.user_agent = random.choice(USER_AGENTS)
+        self.viewport = random.choice(VIEWPORT_SIZES)
+        # Per-host navigation slots, shared by every scraper on this browser
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self.max_idle_contexts = max_idle_contexts
+        # Set-up contexts awaiting reuse, by storage state key
+        self._idle_contexts: dict[Optional[str], list[BrowserContext]] = {}
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
 
@@ -179,6 +232,10 @@ class BrowserManager:
 
     async def stop(self) -> None:
         """Stop the browser and cleanup."""
+        idle_contexts = [c for contexts in self._idle_contexts.values() for c in contexts]
+        self._idle_contexts.clear()
+        for context in idle_contexts:
+            await context.close()
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -186,24 +243,81 @@ class BrowserManager:
             await self._playwright.stop()
             self._playwright = None
 
+    def _load_state(self, state_key: str) -> Optional[dict]:
+        """Load persisted storage state, ignoring missing or corrupt files."""
+        try:
+            return json.loads((self.state_dir / f"{state_key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self, state_key: str, state: dict) -> None:
+        """Persist storage state atomically so concurrent pages never read a partial file."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        path = self.state_dir / f"{state_key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{id(state)}.tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, path)
+
     @asynccontextmanager
-    async def get_page(self) -> AsyncGenerator[Page, None]:
+    async def get_page(self, state_key: Optional[str] = None) -> AsyncGenerator[Page, None]:
         """Get a new stealth page.
 
+        Pages are opened in a pooled context, so the stealth set-up runs
+        once per context rather than once per page.
+
+        Args:
+            state_key: If given, cookies and localStorage saved under this
+                key are restored into the page's context, and saved back
+                once the page is used without error. This skips consent
+                banners and session setup on later visits.
+
         Yields:
             A configured Page instance.
         """
         if self._browser is None:
             await self.start()
 
-        context = await create_stealth_context(self._browser)
+        idle = self._idle_contexts.setdefault(state_key, [])
+        if idle:
+            # Already has the stealth script, routes and this key's state
+            context = idle.pop()
+        else:
+            storage_state = self._load_state(state_key) if state_key else None
+            context = await create_stealth_context(
+                self._browser,
+                user_agent=self.user_agent,
+                viewport=self.viewport,
+                storage_state=storage_state,
+            )
         page = await context.new_page()
 
+        reusable = False
         try:
             yield page
+            if state_key:
+                self._save_state(state_key, await context.storage_state())
+            reusable = True
         finally:
             await page.close()
-            await context.close()
+            # Only reuse contexts whose page finished cleanly, up to the cap
+            if reusable and self._browser is not None and len(idle) < self.max_idle_contexts:
+                idle.append(context)
+            else:
+                await context.close()
+
+    def host_slot(self, host: str) -> asyncio.Semaphore:
+        """Get the semaphore capping concurrent navigations to a host.
+
+        Args:
+            host: Hostname being navigated to.
+
+        Returns:
+            Semaphore shared by all pages of this browser.
+        """
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
 
     async def delay(self, min_seconds: Optional[float] = None, max_seconds: Optional[float] = None) -> None:
         """Add a random delay between requests.
@@ -230,6 +344,65 @@ class BrowserManager:
         await self.stop()
 
 
+# Waits in the page until results (or the empty-state marker) appear, then
+# maps an element extractor over every result. __EXTRACT__ is replaced by
+# the caller's "(el) => ({...})" function source.
+_EXTRACT_WHEN_READY_JS = """async ([readySelector, emptySelector, itemSelector, timeout]) => {
+    const extract = __EXTRACT__;
+    const ready = () => document.querySelector(readySelector) !== null;
+    if (!ready()) {
+        await new Promise((resolve, reject) => {
+            const observer = new MutationObserver(() => {
+                if (ready()) {
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    resolve();
+                }
+            });
+            const timer = setTimeout(() => {
+                observer.disconnect();
+                reject(new Error(`Timed out waiting for ${readySelector}`));
+            }, timeout);
+            observer.observe(document.documentElement, {childList: true, subtree: true});
+        });
+    }
+    if (document.querySelector(emptySelector) !== null) {
+        return [];
+    }
+    return Array.from(document.querySelectorAll(itemSelector), (el) => extract(el));
+}"""
+
+
+async def extract_when_ready(
+    page: Page,
+    ready_selector: str,
+    empty_selector: str,
+    item_selector: str,
+    extract_js: str,
+    timeout: int = 30000,
+) -> list[dict]:
+    """Wait for results and extract every item in one browser round-trip.
+
+    Args:
+        page: Page instance.
+        ready_selector: Selector that appears once results (or the
+            empty-state marker) have rendered.
+        empty_selector: Selector for the "no results" marker.
+        item_selector: Selector for each result item.
+        extract_js: JS function source taking an element and returning
+            a plain object of its fields.
+        timeout: Timeout in milliseconds.
+
+    Returns:
+        Extracted fields for each item, or an empty list if the
+        empty-state marker is shown.
+    """
+    script = _EXTRACT_WHEN_READY_JS.replace("__EXTRACT__", extract_js)
+    return await page.evaluate(
+        script, [ready_selector, empty_selector, item_selector, timeout]
+    )
+
+
 async def wait_for_page_load(page: Page, timeout: int = 30000) -> None:
     """Wait for page to fully load.
 
@@ -260,10 +433,16 @@ async def type_like_human(page: Page, selector: str, text: str) -> None:
         selector: Element selector.
         text: Text to type.
     """
-    element = await page.query_selector(selector)
-    if element:
-        await element.click()
-        for char in text:
-            await page.keyboard.type(char, delay=random.randint(50, 150))
-            if random.random() < 0.1:  # 10% chance of extra pause
+    locator = page.locator(selector).first
+    if await locator.count():
+        await locator.click()
+        # Type in up to three runs with a pause between, instead of one
+        # browser round-trip per character
+        pauses = min(2, max(len(text) - 1, 0))
+        breaks = sorted(random.sample(range(1, len(text)), pauses))
+        start = 0
+        for end in [*breaks, len(text)]:
+            await locator.press_sequentially(text[start:end], delay=random.randint(50, 150))
+            if end < len(text):
                 await asyncio.sleep(random.uniform(0.1, 0.3))
+            start = end
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
@@ -11,6 +14,25 @@ from typing import Any, Optional
 from diskcache import Cache
 
 
+# Reused for every key; json.dumps(sort_keys=True) builds a new encoder
+# per call. Output is identical, so existing keys still match.
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True)
+
+# Entries kept in memory in front of the disk cache, per ResponseCache
+_MEMORY_SIZE = 512
+
+
+def _age_seconds(cached_at: Any) -> float:
+    """Seconds since an entry's _cached_at stamp.
+
+    Entries store an epoch timestamp; ones written before that store an
+    ISO string, which is still understood.
+    """
+    if isinstance(cached_at, str):
+        return (datetime.now() - datetime.fromisoformat(cached_at)).total_seconds()
+    return time.time() - cached_at
+
+
 class ResponseCache:
     """Caches scraper responses to disk."""
 
@@ -19,6 +41,7 @@ class ResponseCache:
         cache_dir: Optional[Path] = None,
         default_ttl_hours: int = 6,
         max_size_gb: float = 1.0,
+        durable: bool = False,
     ):
         """Initialize response cache.
 
@@ -26,6 +49,10 @@ class ResponseCache:
             cache_dir: Directory for cache. Defaults to ~/.pointsmaxxer/cache
             default_ttl_hours: Default cache TTL in hours.
             max_size_gb: Maximum cache size in gigabytes.
+            durable: Sync on every commit (SQLite synchronous=FULL). By
+                default NORMAL is used, which is safe under WAL: a power
+                loss can drop the last few writes but can't corrupt the
+                database.
         """
         if cache_dir is None:
             cache_dir = Path.home() / ".pointsmaxxer" / "cache"
@@ -35,7 +62,41 @@ class ResponseCache:
         self.default_ttl = default_ttl_hours * 3600  # Convert to seconds
         self.max_size = int(max_size_gb * 1024 * 1024 * 1024)  # Convert to bytes
 
-        self._cache = Cache(str(cache_dir), size_limit=self.max_size)
+        # diskcache already defaults to WAL and a 32 KB inline-value limit
+        self._cache = Cache(
+            str(cache_dir),
+            size_limit=self.max_size,
+            sqlite_synchronous=2 if durable else 1,  # FULL or NORMAL
+        )
+        # Recently used entries as (expires_at epoch, entry), least recently
+        # used first, so repeat lookups skip SQLite. Scrapers call in from
+        # worker threads, hence the lock.
+        self._memory: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    def _remember(self, key: str, data: dict, expires_at: float) -> None:
+        """Keep an entry in the in-memory front cache."""
+        with self._memory_lock:
+            self._memory[key] = (expires_at, data)
+            self._memory.move_to_end(key)
+            if len(self._memory) > _MEMORY_SIZE:
+                self._memory.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[dict]:
+        """Get a raw cache entry, from memory if possible."""
+        with self._memory_lock:
+            remembered = self._memory.get(key)
+            if remembered is not None:
+                expires_at, data = remembered
+                if time.time() < expires_at:
+                    self._memory.move_to_end(key)
+                    return data
+                del self._memory[key]
+
+        data, expires_at = self._cache.get(key, expire_time=True)
+        if data is not None:
+            self._remember(key, data, expires_at or float("inf"))
+        return data
 
     def _make_key(self, *args, **kwargs) -> str:
         """Generate a cache key from arguments.
@@ -47,7 +108,7 @@ class ResponseCache:
         Returns:
             Cache key string.
         """
-        key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
+        key_data = _KEY_ENCODER.encode({"args": args, "kwargs": kwargs})
         return hashlib.sha256(key_data.encode()).hexdigest()[:32]
 
     def get(
@@ -65,23 +126,42 @@ class ResponseCache:
             Cached value or None if not found/expired.
         """
         try:
-            data = self._cache.get(key)
+            data = self._load(key)
             if data is None:
                 return None
 
             # Check age if specified
             if max_age_hours is not None:
                 cached_at = data.get("_cached_at")
-                if cached_at:
-                    cached_time = datetime.fromisoformat(cached_at)
-                    max_age = timedelta(hours=max_age_hours)
-                    if datetime.now() - cached_time > max_age:
-                        return None
+                if cached_at and _age_seconds(cached_at) > max_age_hours * 3600:
+                    return None
 
             return data.get("value")
         except Exception:
             return None
 
+    def get_entry(self, key: str) -> Optional[tuple[Any, timedelta]]:
+        """Get a cached value along with its age.
+
+        Unlike get(), a cached None is returned as an entry, so callers
+        can cache negative results and tell them apart from a miss.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Tuple of (value, age), or None if not found.
+        """
+        try:
+            data = self._load(key)
+            if data is None:
+                return None
+
+            age = timedelta(seconds=_age_seconds(data["_cached_at"]))
+            return data.get("value"), age
+        except Exception:
+            return None
+
     def set(
         self,
         key: str,
@@ -96,13 +176,37 @@ class ResponseCache:
             ttl_hours: TTL in hours. Uses default if None.
         """
         ttl = (ttl_hours * 3600) if ttl_hours else self.default_ttl
+        now = time.time()
 
         data = {
             "value": value,
-            "_cached_at": datetime.now().isoformat(),
+            "_cached_at": now,
         }
 
         self._cache.set(key, data, expire=ttl)
+        self._remember(key, data, now + ttl)
+
+    def incr(self, key: str, ttl_hours: Optional[int] = None) -> int:
+        """Add one to a counter and return the new count.
+
+        The update is atomic on disk, so every process and ResponseCache
+        sharing the cache directory counts against the same total.
+        Counters skip the in-memory front cache and can't be read with
+        get().
+
+        Args:
+            key: Counter key.
+            ttl_hours: TTL in hours, set when the counter is created. Uses
+                default if None.
+
+        Returns:
+            Count after the increment.
+        """
+        ttl = (ttl_hours * 3600) if ttl_hours else self.default_ttl
+        with self._cache.transact():
+            # Starts the counter, with its expiry, if missing or expired
+            self._cache.add(key, 0, expire=ttl)
+            return self._cache.incr(key)
 
     def delete(self, key: str) -> bool:
         """Delete cached value.
@@ -113,10 +217,14 @@ class ResponseCache:
         Returns:
             True if key existed and was deleted.
         """
+        with self._memory_lock:
+            self._memory.pop(key, None)
         return self._cache.delete(key)
 
     def clear(self) -> None:
         """Clear all cached data."""
+        with self._memory_lock:
+            self._memory.clear()
         self._cache.clear()
 
     def get_or_fetch(
@@ -171,15 +279,45 @@ class ResponseCache:
         self.set(key, value, ttl_hours=ttl_hours)
         return value
 
-    def cache_search(
+    def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get several cached values in one transaction.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Cached values (or None) in the order of keys.
+        """
+        with self._cache.transact():
+            return [self.get(key) for key in keys]
+
+    def set_many(
+        self,
+        items: dict[str, Any],
+        ttl_hours: Optional[int] = None,
+    ) -> None:
+        """Set several cached values in one transaction.
+
+        Args:
+            items: Values by cache key.
+            ttl_hours: TTL in hours. Uses default if None.
+        """
+        with self._cache.transact():
+            for key, value in items.items():
+                self.set(key, value, ttl_hours=ttl_hours)
+
+    def search_key(
         self,
         origin: str,
         destination: str,
         date: str,
         cabin: str,
         program: str,
-    ) -> Optional[dict]:
-        """Get cached search results.
+    ) -> str:
+        """Get the cache key cache_search and set_search use.
+
+        Callers doing a lookup and a store for the same search can derive
+        the key once and use get() and set() directly.
 
         Args:
             origin: Origin airport.
@@ -189,9 +327,9 @@ class ResponseCache:
             program: Program code.
 
         Returns:
-            Cached search results or None.
+            Cache key string.
         """
-        key = self._make_key(
+        return self._make_key(
             "search",
             origin=origin,
             destination=destination,
@@ -199,6 +337,28 @@ class ResponseCache:
             cabin=cabin,
             program=program,
         )
+
+    def cache_search(
+        self,
+        origin: str,
+        destination: str,
+        date: str,
+        cabin: str,
+        program: str,
+    ) -> Optional[dict]:
+        """Get cached search results.
+
+        Args:
+            origin: Origin airport.
+            destination: Destination airport.
+            date: Date string (YYYY-MM-DD).
+            cabin: Cabin class.
+            program: Program code.
+
+        Returns:
+            Cached search results or None.
+        """
+        key = self.search_key(origin, destination, date, cabin, program)
         return self.get(key)
 
     def set_search(
@@ -222,14 +382,7 @@ class ResponseCache:
             results: Search results to cache.
             ttl_hours: Cache TTL in hours.
         """
-        key = self._make_key(
-            "search",
-            origin=origin,
-            destination=destination,
-            date=date,
-            cabin=cabin,
-            program=program,
-        )
+        key = self.search_key(origin, destination, date, cabin, program)
         self.set(key, results, ttl_hours=ttl_hours)
 
     def cache_cash_price(
@@ -5,12 +5,20 @@ from __future__ import annotations
 import asyncio
 import random
 import math
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import numpy as np
 from playwright.async_api import Page
 
 
+# Random source for path noise and timing jitter
+_rng = np.random.default_rng()
+
+# Moves shorter than this go straight to the target in one step
+_DIRECT_MOVE_PIXELS = 20
+
+
 def bezier_curve(
     p0: Tuple[float, float],
     p1: Tuple[float, float],
@@ -30,20 +38,22 @@ def bezier_curve(
     Returns:
         List of (x, y) points along the curve.
     """
-    points = []
-    for i in range(num_points):
-        t = i / (num_points - 1)
-        t2 = t * t
-        t3 = t2 * t
-        mt = 1 - t
-        mt2 = mt * mt
-        mt3 = mt2 * mt
+    return list(map(tuple, _bezier_points(p0, p1, p2, p3, num_points).tolist()))
 
-        x = mt3 * p0[0] + 3 * mt2 * t * p1[0] + 3 * mt * t2 * p2[0] + t3 * p3[0]
-        y = mt3 * p0[1] + 3 * mt2 * t * p1[1] + 3 * mt * t2 * p2[1] + t3 * p3[1]
-        points.append((x, y))
 
-    return points
+def _bezier_points(
+    p0: Tuple[float, float],
+    p1: Tuple[float, float],
+    p2: Tuple[float, float],
+    p3: Tuple[float, float],
+    num_points: int,
+) -> np.ndarray:
+    """Evaluate a cubic Bezier curve as a (num_points, 2) array."""
+    # Bernstein basis for every t at once, one row per point
+    t = np.linspace(0.0, 1.0, num_points)
+    mt = 1.0 - t
+    basis = np.stack((mt * mt * mt, 3 * mt * mt * t, 3 * mt * t * t, t * t * t), axis=1)
+    return basis @ np.array((p0, p1, p2, p3), dtype=np.float64)
 
 
 def generate_control_points(
@@ -85,13 +95,9 @@ def add_noise(points: list[Tuple[float, float]], noise_level: float = 1.0) -> li
     Returns:
         Points with noise added.
     """
-    return [
-        (
-            x + random.uniform(-noise_level, noise_level),
-            y + random.uniform(-noise_level, noise_level)
-        )
-        for x, y in points
-    ]
+    noisy = np.array(points, dtype=np.float64).reshape(-1, 2)
+    noisy += _rng.uniform(-noise_level, noise_level, noisy.shape)
+    return list(map(tuple, noisy.tolist()))
 
 
 def calculate_delays(num_points: int, total_time: float) -> list[float]:
@@ -106,22 +112,24 @@ def calculate_delays(num_points: int, total_time: float) -> list[float]:
     Returns:
         List of delay times in seconds.
     """
-    delays = []
-    for i in range(num_points - 1):
-        # Ease-in-out function
-        t = i / (num_points - 1)
-        # Slower at start and end, faster in middle
-        ease = 0.5 - math.cos(t * math.pi) / 2
+    return _easing_delays(num_points, total_time).tolist()
 
-        # Base delay with easing
-        base_delay = total_time / num_points
-        delay = base_delay * (0.5 + ease)
 
-        # Add small random variation
-        delay *= random.uniform(0.8, 1.2)
-        delays.append(delay)
+@lru_cache(maxsize=64)
+def _ease_table(num_points: int) -> np.ndarray:
+    """Ease-in-out factors for each delay of a num_points path (read-only)."""
+    # Slower at start and end, faster in middle
+    t = np.arange(num_points - 1) / (num_points - 1)
+    table = 1.0 - np.cos(t * np.pi) / 2  # 0.5 + ease
+    table.flags.writeable = False
+    return table
 
-    return delays
+
+def _easing_delays(num_points: int, total_time: float) -> np.ndarray:
+    """Compute calculate_delays as an array."""
+    # Base delay with easing, plus small random variation
+    base_delay = total_time / num_points
+    return base_delay * _ease_table(num_points) * _rng.uniform(0.8, 1.2, num_points - 1)
 
 
 class HumanMouse:
@@ -190,22 +198,50 @@ class HumanMouse:
             # ~200-400ms per 500 pixels
             duration = (distance / 500) * random.uniform(0.2, 0.4) / self.speed
 
+        # A curve over a few pixels is indistinguishable from a straight hop
+        if distance < _DIRECT_MOVE_PIXELS:
+            await asyncio.sleep(duration)
+            await self.page.mouse.move(*end)
+            self._current_pos = end
+            return
+
         # Generate path points
         num_points = max(10, int(distance / 10))  # 1 point per 10 pixels minimum
+        # Path, noise and delays are built as arrays in one go; only the
+        # moves themselves run point by point
         control_points = generate_control_points(start, end, self.deviation)
-        path = bezier_curve(start, control_points[0], control_points[1], end, num_points)
-        path = add_noise(path, self.noise)
+        path = _bezier_points(start, control_points[0], control_points[1], end, num_points)
+        path += _rng.uniform(-self.noise, self.noise, path.shape)
 
         # Calculate delays
-        delays = calculate_delays(num_points, duration)
+        delays = _easing_delays(num_points, duration).tolist()
 
         # Execute movement
-        for i, (px, py) in enumerate(path):
+        for i, (px, py) in enumerate(path.tolist()):
             await self.page.mouse.move(px, py)
             self._current_pos = (px, py)
             if i < len(delays):
                 await asyncio.sleep(delays[i])
 
+    async def move_through(self, points) -> None:
+        """Move mouse through a sequence of positions in order.
+
+        Segment durations are worked out for the whole route up front,
+        using the same distance-based timing as move_to.
+
+        Args:
+            points: Sequence of (x, y) coordinates, or an (N, 2) array.
+        """
+        start = await self.get_current_position()
+        stops = np.vstack((start, np.asarray(points, dtype=np.float64).reshape(-1, 2)))
+
+        # ~200-400ms per 500 pixels for each segment
+        distances = np.hypot(*np.diff(stops, axis=0).T)
+        durations = (distances / 500) * _rng.uniform(0.2, 0.4, len(distances)) / self.speed
+
+        for (x, y), duration in zip(stops[1:].tolist(), durations.tolist()):
+            await self.move_to(x, y, duration=duration)
+
     async def click(
         self,
         x: Optional[float] = None,
@@ -15,7 +15,7 @@ from pointsmaxxer.models import (
 from pointsmaxxer.analyzer import DealAnalyzer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_config():
     return AppConfig(
         portfolio=[
@@ -36,7 +36,7 @@ def sample_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_flight():
     return Flight(
         flight_no="NH7",
@@ -50,7 +50,7 @@ def sample_flight():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_award(sample_flight):
     return Award(
         flight=sample_flight,
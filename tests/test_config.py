@@ -1,6 +1,5 @@
 """Tests for configuration loading."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -16,9 +15,12 @@ from pointsmaxxer.config import (
 )
 from pointsmaxxer.models import CabinClass
 
+# libyaml when PyYAML was built with it, as load_config uses
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class TestLoadConfig:
-    def test_load_from_file(self):
+    def test_load_from_file(self, tmp_path):
         config_data = {
             "portfolio": [
                 {"name": "Test Program", "code": "test", "balance": 50000}
@@ -31,19 +33,15 @@ class TestLoadConfig:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = Path(f.name)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_data, Dumper=_Dumper))
 
-        try:
-            config = load_config(temp_path)
+        config = load_config(config_path)
 
-            assert len(config.portfolio) == 1
-            assert config.portfolio[0].code == "test"
-            assert config.portfolio[0].balance == 50000
-            assert config.settings.unicorn_threshold_cpp == 8.0
-        finally:
-            temp_path.unlink()
+        assert len(config.portfolio) == 1
+        assert config.portfolio[0].code == "test"
+        assert config.portfolio[0].balance == 50000
+        assert config.settings.unicorn_threshold_cpp == 8.0
 
     def test_load_default_when_missing(self):
         config = load_config(Path("/nonexistent/config.yaml"))
@@ -88,6 +86,8 @@ class TestParseConfig:
                 "unicorn_threshold_cpp": 10.0,
                 "search_window_days": 120,
                 "max_stops": 0,
+                "max_concurrency": 5,
+                "max_per_host": 1,
             }
         }
 
@@ -97,6 +97,8 @@ class TestParseConfig:
         assert config.settings.unicorn_threshold_cpp == 10.0
         assert config.settings.search_window_days == 120
         assert config.settings.max_stops == 0
+        assert config.settings.max_concurrency == 5
+        assert config.settings.max_per_host == 1
 
     def test_parse_transfers(self):
         raw = {
@@ -126,7 +128,7 @@ class TestParseConfig:
 
 
 class TestSaveConfig:
-    def test_save_and_reload(self):
+    def test_save_and_reload(self, tmp_path):
         from pointsmaxxer.models import AppConfig, PointsProgram, Route, Settings
 
         config = AppConfig(
@@ -139,18 +141,13 @@ class TestSaveConfig:
             settings=Settings(unicorn_threshold_cpp=8.0),
         )
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            save_config(config, temp_path)
-            loaded = load_config(temp_path)
+        config_path = tmp_path / "config.yaml"
+        save_config(config, config_path)
+        loaded = load_config(config_path)
 
-            assert len(loaded.portfolio) == 1
-            assert loaded.portfolio[0].code == "test"
-            assert loaded.settings.unicorn_threshold_cpp == 8.0
-        finally:
-            temp_path.unlink()
+        assert len(loaded.portfolio) == 1
+        assert loaded.portfolio[0].code == "test"
+        assert loaded.settings.unicorn_threshold_cpp == 8.0
 
 
 class TestDefaultConfig:
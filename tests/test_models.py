@@ -17,6 +17,30 @@ from pointsmaxxer.models import (
 )
 
 
+@pytest.fixture(scope="module")
+def sample_flight():
+    return Flight(
+        flight_no="NH7",
+        airline_code="NH",
+        origin="SFO",
+        destination="NRT",
+        departure=datetime.now(),
+        arrival=datetime.now(),
+        duration_minutes=675,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_award(sample_flight):
+    return Award(
+        flight=sample_flight,
+        program="ana",
+        miles=85000,
+        cash_fees=100,
+        cabin=CabinClass.BUSINESS,
+    )
+
+
 class TestPointsProgram:
     def test_create_program(self):
         program = PointsProgram(
@@ -85,18 +109,6 @@ class TestFlight:
 
 
 class TestAward:
-    @pytest.fixture
-    def sample_flight(self):
-        return Flight(
-            flight_no="NH7",
-            airline_code="NH",
-            origin="SFO",
-            destination="NRT",
-            departure=datetime.now(),
-            arrival=datetime.now(),
-            duration_minutes=675,
-        )
-
     def test_create_award(self, sample_flight):
         award = Award(
             flight=sample_flight,
@@ -122,25 +134,6 @@ class TestAward:
 
 
 class TestDeal:
-    @pytest.fixture
-    def sample_award(self):
-        flight = Flight(
-            flight_no="NH7",
-            airline_code="NH",
-            origin="SFO",
-            destination="NRT",
-            departure=datetime.now(),
-            arrival=datetime.now(),
-            duration_minutes=675,
-        )
-        return Award(
-            flight=flight,
-            program="ana",
-            miles=85000,
-            cash_fees=100,
-            cabin=CabinClass.BUSINESS,
-        )
-
     def test_create_deal(self, sample_award):
         deal = Deal(
             award=sample_award,
@@ -6,8 +6,7 @@ from pointsmaxxer.models import AppConfig, PointsProgram, Settings
 from pointsmaxxer.portfolio import PortfolioManager, TransferPath
 
 
-@pytest.fixture
-def sample_config():
+def _make_config():
     return AppConfig(
         portfolio=[
             PointsProgram(name="Chase UR", code="chase_ur", balance=180000),
@@ -28,6 +27,18 @@ def sample_config():
     )
 
 
+@pytest.fixture(scope="module")
+def sample_config():
+    # Shared by every read-only test; tests that change the portfolio use
+    # mutable_config
+    return _make_config()
+
+
+@pytest.fixture
+def mutable_config():
+    return _make_config()
+
+
 class TestPortfolioManager:
     def test_get_balance(self, sample_config):
         manager = PortfolioManager(sample_config)
@@ -95,6 +106,16 @@ class TestTransferPaths:
         chase_path = next((p for p in paths if p.source_program == "chase_ur"), None)
         assert chase_path.can_afford is False
 
+    def test_transfer_path_is_frozen(self, sample_config):
+        from dataclasses import FrozenInstanceError
+
+        manager = PortfolioManager(sample_config)
+        path = manager.find_transfer_paths("united", 50000)[0]
+
+        assert isinstance(path, TransferPath)
+        with pytest.raises(FrozenInstanceError):
+            path.points_needed = 1
+
     def test_get_best_transfer_path(self, sample_config):
         manager = PortfolioManager(sample_config)
 
@@ -106,6 +127,22 @@ class TestTransferPaths:
         # Should be Chase UR since it's the only option
         assert path.source_program == "chase_ur"
 
+    def test_get_best_transfer_path_direct(self, sample_config):
+        manager = PortfolioManager(sample_config)
+
+        # AA balance covers it directly
+        path = manager.get_best_transfer_path("aa", 40000)
+
+        assert path is not None
+        assert path.is_direct is True
+        assert path.source_program == "aa"
+
+    def test_find_transfer_paths_unreachable(self, sample_config):
+        manager = PortfolioManager(sample_config)
+
+        assert manager.find_transfer_paths("emirates", 50000) == []
+        assert manager.get_best_transfer_path("emirates", 50000) is None
+
 
 class TestProgramsTransferTo:
     def test_get_programs_that_transfer_to(self, sample_config):
@@ -140,24 +177,35 @@ class TestPortfolioSummary:
 
 
 class TestPortfolioModification:
-    def test_update_balance(self, sample_config):
-        manager = PortfolioManager(sample_config)
+    def test_update_balance(self, mutable_config):
+        manager = PortfolioManager(mutable_config)
 
         assert manager.update_balance("chase_ur", 200000) is True
         assert manager.get_balance("chase_ur") == 200000
 
         assert manager.update_balance("nonexistent", 100) is False
 
-    def test_add_program(self, sample_config):
-        manager = PortfolioManager(sample_config)
+    def test_add_program(self, mutable_config):
+        manager = PortfolioManager(mutable_config)
 
         new_program = PointsProgram(name="Bilt", code="bilt", balance=45000)
         manager.add_program(new_program)
 
         assert manager.get_balance("bilt") == 45000
 
-    def test_add_program_update_existing(self, sample_config):
-        manager = PortfolioManager(sample_config)
+    def test_add_program_refreshes_name(self, mutable_config):
+        manager = PortfolioManager(mutable_config)
+
+        assert manager.get_program_name("bilt") == "BILT"
+
+        manager.add_program(PointsProgram(name="Bilt Rewards", code="bilt", balance=45000))
+        assert manager.get_program_name("bilt") == "Bilt Rewards"
+
+        manager.remove_program("bilt")
+        assert manager.get_program_name("bilt") == "BILT"
+
+    def test_add_program_update_existing(self, mutable_config):
+        manager = PortfolioManager(mutable_config)
 
         # Update existing program
         updated = PointsProgram(name="Chase UR", code="chase_ur", balance=250000)
@@ -165,13 +213,13 @@ class TestPortfolioModification:
 
         assert manager.get_balance("chase_ur") == 250000
         # Should not duplicate
-        assert len(sample_config.portfolio) == 3
+        assert len(mutable_config.portfolio) == 3
 
-    def test_remove_program(self, sample_config):
-        manager = PortfolioManager(sample_config)
+    def test_remove_program(self, mutable_config):
+        manager = PortfolioManager(mutable_config)
 
         assert manager.remove_program("aa") is True
         assert manager.get_balance("aa") == 0
-        assert len(sample_config.portfolio) == 2
+        assert len(mutable_config.portfolio) == 2
 
         assert manager.remove_program("nonexistent") is False
@@ -0,0 +1,292 @@
+"""Tests for shared scraper behaviour."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import httpx
+import pytest
+from tenacity import wait_none
+
+from pointsmaxxer.models import CabinClass
+from pointsmaxxer.scrapers import base, seats_aero
+from pointsmaxxer.scrapers.aa import AAScraper
+from pointsmaxxer.scrapers.base import (
+    AuthenticationError,
+    BaseScraper,
+    ParseError,
+    QuotaExceededError,
+    RateLimitError,
+)
+from pointsmaxxer.scrapers.seats_aero import SeatsAeroScraper
+from pointsmaxxer.utils.cache import ResponseCache
+
+
+def _without_backoff(method):
+    """The tenacity-wrapped method with its waits removed."""
+    return method.retry_with(wait=wait_none())
+
+
+class TestRetryAndCoalesce:
+    async def test_transient_error_is_retried(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RateLimitError("slow down")
+            return "ok"
+
+        assert await _without_backoff(BaseScraper._fetch_with_retry)(None, fetch) == "ok"
+        assert len(calls) == 2
+
+    async def test_concurrent_callers_share_one_fetch(self):
+        scraper = AAScraper()
+        calls = []
+        release = asyncio.Event()
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return ["award"]
+
+        first = asyncio.create_task(scraper._coalesce("key", fetch))
+        second = asyncio.create_task(scraper._coalesce("key", fetch))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == await second == ["award"]
+        assert len(calls) == 1
+        assert scraper._inflight == {}
+
+    async def test_coalesce_does_not_retry(self):
+        # Retries belong to _fetch_with_retry, not around every shared fetch
+        scraper = AAScraper()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            raise ParseError("bad page")
+
+        with pytest.raises(ParseError):
+            await scraper._coalesce("key", fetch)
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("error", [AuthenticationError, QuotaExceededError])
+    async def test_auth_and_quota_errors_are_not_retried(self, error):
+        # Retrying these can't succeed and would spend more daily quota
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            raise error("no")
+
+        with pytest.raises(error):
+            await _without_backoff(BaseScraper._fetch_with_retry)(None, fetch)
+        assert len(calls) == 1
+
+
+def _make_award(scraper, origin="JFK", destination="LHR"):
+    flight = scraper.create_flight(
+        flight_no="AA100",
+        airline_code="AA",
+        origin=origin,
+        destination=destination,
+        departure=datetime(2026, 3, 1, 18, 0),
+        arrival=datetime(2026, 3, 2, 6, 0),
+        duration_minutes=420,
+    )
+    return scraper.create_award(flight, miles=57500, cabin=CabinClass.BUSINESS)
+
+
+class TestEmptyResults:
+    async def test_empty_result_is_scraped_again(self, tmp_path, monkeypatch):
+        scraper = AAScraper(cache=ResponseCache(tmp_path))
+        results = [[], [_make_award(scraper)]]
+        scrapes = []
+
+        @asynccontextmanager
+        async def fake_page(state_key=None):
+            yield None
+
+        async def fake_goto(page, url):
+            pass
+
+        async def fake_parse(page, origin, destination, date, cabin):
+            scrapes.append(date)
+            return results.pop(0)
+
+        monkeypatch.setattr(scraper, "_page", fake_page)
+        monkeypatch.setattr(scraper, "_goto", fake_goto)
+        monkeypatch.setattr(scraper, "_parse_results", fake_parse)
+
+        date = datetime(2026, 3, 1)
+        assert await scraper.search_awards("JFK", "LHR", date, CabinClass.BUSINESS) == []
+        awards = await scraper.search_awards("JFK", "LHR", date, CabinClass.BUSINESS)
+        assert len(awards) == 1
+        assert len(scrapes) == 2
+
+
+class TestMemoryCache:
+    def test_empty_result_not_remembered(self):
+        scraper = AAScraper()
+        scraper._remember_awards("key", [], ttl_hours=6)
+        assert scraper._recall_awards("key") is None
+
+    def test_cache_is_per_instance(self):
+        scraper = AAScraper()
+        scraper._remember_awards("key", [_make_award(scraper)], ttl_hours=6)
+        assert len(scraper._recall_awards("key")) == 1
+        assert AAScraper()._recall_awards("key") is None
+
+    def test_least_recently_used_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(base, "_MEMORY_CACHE_SIZE", 2)
+        scraper = AAScraper()
+        awards = [_make_award(scraper)]
+        scraper._remember_awards("a", awards, ttl_hours=6)
+        scraper._remember_awards("b", awards, ttl_hours=6)
+        scraper._recall_awards("a")
+        scraper._remember_awards("c", awards, ttl_hours=6)
+        assert scraper._recall_awards("a") is not None
+        assert scraper._recall_awards("b") is None
+        assert scraper._recall_awards("c") is not None
+
+    def test_entries_expire(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+        scraper = AAScraper()
+        scraper._remember_awards("key", [_make_award(scraper)], ttl_hours=6)
+        now[0] += 6 * 3600 - 1
+        assert scraper._recall_awards("key") is not None
+        now[0] += 1
+        assert scraper._recall_awards("key") is None
+
+
+class TestSeatsAeroQuota:
+    async def test_quota_shared_across_instances(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(seats_aero, "_DAILY_QUOTA", 3)
+        first = SeatsAeroScraper(api_key="key", cache=ResponseCache(tmp_path))
+        second = SeatsAeroScraper(api_key="key", cache=ResponseCache(tmp_path))
+
+        await first._reserve_request()
+        await second._reserve_request()
+        await first._reserve_request()
+
+        with pytest.raises(QuotaExceededError):
+            await second._reserve_request()
+        with pytest.raises(QuotaExceededError):
+            await first._reserve_request()
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.pages = []
+
+    @asynccontextmanager
+    async def get_page(self, state_key=None):
+        page = _FakePage()
+        self.pages.append(page)
+        try:
+            yield page
+        finally:
+            page.closed = True
+
+
+class TestPagePool:
+    async def test_pages_reused_after_success(self):
+        browser = _FakeBrowser()
+        scraper = AAScraper(browser_manager=browser)
+        async with scraper.pooled_pages():
+            async with scraper._page() as first:
+                pass
+            async with scraper._page() as second:
+                pass
+            assert second is first
+            assert not first.closed
+        assert first.closed
+
+    async def test_page_closed_after_failure(self):
+        browser = _FakeBrowser()
+        scraper = AAScraper(browser_manager=browser)
+        async with scraper.pooled_pages():
+            with pytest.raises(ParseError):
+                async with scraper._page() as broken:
+                    raise ParseError("navigation timed out")
+            assert broken.closed
+            async with scraper._page() as page:
+                assert page is not broken
+        assert len(browser.pages) == 2
+
+    async def test_closed_page_not_reused(self):
+        browser = _FakeBrowser()
+        scraper = AAScraper(browser_manager=browser)
+        async with scraper.pooled_pages():
+            async with scraper._page() as crashed:
+                crashed.closed = True
+            async with scraper._page() as page:
+                assert page is not crashed
+
+
+class TestSeatsAeroBulk:
+    async def test_multi_date_response_bucketed_by_date(self, tmp_path):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.params)
+            rows = [
+                {
+                    "Date": day,
+                    "JAvailable": True,
+                    "JMileageCost": "70000",
+                    "JRemainingSeats": 2,
+                    "JAirlines": "NH",
+                    "JDirect": True,
+                    "Route": {
+                        "OriginAirport": "SFO",
+                        "DestinationAirport": "NRT",
+                        "Source": "united",
+                    },
+                }
+                for day in ("2026-03-01", "2026-03-01", "2026-03-03")
+            ]
+            return httpx.Response(200, json={"data": rows})
+
+        scraper = SeatsAeroScraper(api_key="key", cache=ResponseCache(tmp_path))
+        scraper._client = httpx.AsyncClient(
+            base_url=scraper.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        results = await scraper.search_awards_bulk(
+            [("sfo", "nrt")], datetime(2026, 3, 1), datetime(2026, 3, 7), CabinClass.BUSINESS
+        )
+        await scraper.close()
+
+        assert len(requests) == 1
+        assert requests[0]["start_date"] == "2026-03-01"
+        assert requests[0]["end_date"] == "2026-03-07"
+        assert {key: len(awards) for key, awards in results.items()} == {
+            ("SFO", "NRT", "2026-03-01"): 2,
+            ("SFO", "NRT", "2026-03-03"): 1,
+        }
+
+
+
+class TestSeatsAeroErrors:
+    async def test_invalid_api_key(self, tmp_path):
+        scraper = SeatsAeroScraper(api_key="bad", cache=ResponseCache(tmp_path))
+        scraper._client = httpx.AsyncClient(
+            base_url=scraper.BASE_URL,
+            transport=httpx.MockTransport(lambda request: httpx.Response(401)),
+        )
+        with pytest.raises(AuthenticationError) as excinfo:
+            await scraper.search_awards("SFO", "NRT", datetime(2026, 3, 1), CabinClass.BUSINESS)
+        await scraper.close()
+        # Still a ParseError for callers that catch those
+        assert isinstance(excinfo.value, ParseError)